@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.batching
+~~~~~~~~~~~~~~~
+
+This module implements request deduplication and micro-batching across concurrent callers.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Generic, Hashable, List, Mapping, Optional, Set, Tuple, TypeVar
+
+from .exceptions import KiwoomAPIError
+
+K = TypeVar("K", bound=Hashable)
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+def request_key(api_id: str, body: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    (api-id, 요청 본문)으로 동일 요청을 식별하는 키를 만듭니다.
+    """
+    return api_id, json.dumps(body or {}, sort_keys=True, ensure_ascii=False)
+
+
+class RequestCoalescer:
+    """
+    동일한 키의 요청이 진행 중이면 새 요청을 보내지 않고 진행 중인 결과를 공유합니다.
+
+    결과 객체는 모든 대기자에게 같은 인스턴스로 전달되므로 수정하지 않아야 합니다.
+    대기자 중 하나가 취소되어도 공유된 요청은 취소되지 않습니다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 고유 요청 수."""
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        `key`에 해당하는 요청을 실행하거나, 이미 진행 중이면 그 결과를 기다립니다.
+
+        Args:
+            key (Hashable): 요청 식별 키 (예: `request_key(api_id, body)`)
+            factory (Callable[[], Awaitable[T]]): 실제 요청을 만드는 함수
+
+        Returns:
+            T: 요청 결과
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # 모든 대기자가 취소된 경우에도 예외가 회수되지 않았다는 경고가 나지 않도록 합니다.
+            future.exception()
+
+
+class MicroBatcher(Generic[K, V]):
+    """
+    짧은 시간 창 안에 들어온 개별 키 요청을 모아 한 번의 다중 키 요청으로 보냅니다.
+
+    같은 키가 대기 중이거나 진행 중인 배치에 이미 있으면 그 결과를 공유합니다.
+
+    Args:
+        batch_fn (Callable[[List[K]], Awaitable[Mapping[K, V]]]): 키 목록을 받아
+            키별 결과를 돌려주는 다중 키 요청 함수
+        window (float): 첫 요청 이후 배치를 모으는 시간(초)
+        max_batch_size (int): 배치 하나에 담을 최대 키 수. 가득 차면 즉시 보냅니다.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[K]], Awaitable[Mapping[K, V]]],
+        window: float = 0.005,
+        max_batch_size: int = 50,
+    ):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[K, "asyncio.Future[V]"] = {}
+        self._pending: List[K] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, key: K) -> V:
+        """
+        키 하나에 대한 결과를 요청합니다.
+
+        Raises:
+            KiwoomAPIError: 배치 요청이 실패했거나 응답에 해당 키가 없을 때 발생
+        """
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._pending.append(key)
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        keys, self._pending = self._pending, []
+        if keys:
+            # 실행 중인 배치 태스크가 가비지 컬렉션되지 않도록 참조를 유지합니다.
+            task = asyncio.ensure_future(self._run_batch(keys))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: List[K]) -> None:
+        try:
+            results = await self.batch_fn(keys)
+        except BaseException as e:
+            for key in keys:
+                self._resolve(key, error=e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for key in keys:
+            if key in results:
+                self._resolve(key, result=results[key])
+            else:
+                self._resolve(
+                    key,
+                    error=KiwoomAPIError(response=None, error_message=f"No data returned for '{key}'."),
+                )
+
+    def _resolve(self, key: K, result: Any = None, error: Optional[BaseException] = None) -> None:
+        future = self._futures.pop(key)
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+            # 모든 대기자가 취소된 경우의 미회수 예외 경고를 막습니다.
+            future.exception()
+        else:
+            future.set_result(result)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.chart
+~~~~~~~~~~~~
+
+This package contains modules related to chart (차트) APIs and history backfill.
+"""
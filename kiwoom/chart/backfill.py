@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.chart.backfill
+~~~~~~~~~~~~~~~~~~~~~
+
+This module implements a concurrent chart history backfill engine with
+incremental (delta) sync into a local `ChartStore`.
+"""
+
+import asyncio
+from datetime import date
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..exceptions import ChartBackfillError
+from .models import AdjustedPriceType, ChartBar, ChartRow, MinuteScope, TickScope
+from .store import DAILY, ChartStore, interval_key
+
+if TYPE_CHECKING:
+    from ..client import KiwoomClient
+
+
+class ChartBackfillEngine:
+    """
+    여러 종목의 차트 이력을 동시에 내려받아 로컬 저장소에 기록하는 엔진.
+
+    최초 실행 시에는 `start_date`까지의 전체 이력을 받고, 이후 실행에서는
+    저장된 마지막 봉 이후의 변경분만 받습니다. 마지막 봉은 장중에 갱신될 수
+    있으므로 항상 다시 받아 덮어씁니다. 수정주가로 동기화할 때 새 봉에서
+    수정주가 이벤트가 보이면 해당 종목의 이력을 처음부터 다시 받습니다.
+    수정주가와 원주가 이력은 저장소에서 서로 다른 구간 키로 보관됩니다.
+
+    Args:
+        client (KiwoomClient): 인증된 키움 API 클라이언트
+        store (ChartStore): 차트 이력을 기록할 로컬 저장소
+        max_concurrency (int): 동시에 동기화할 최대 종목 수
+    """
+
+    def __init__(self, client: "KiwoomClient", store: ChartStore, max_concurrency: int = 8):
+        self.client = client
+        self.store = store
+        self.max_concurrency = max_concurrency
+
+    async def sync_daily(
+        self,
+        stock_codes: Iterable[str],
+        start_date: Optional[str] = None,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> Dict[str, int]:
+        """
+        일봉 이력을 동기화합니다 (ka10081).
+
+        Args:
+            stock_codes (Iterable[str]): 종목코드 목록
+            start_date (Optional[str]): 최초 백필 시작일자 (YYYYMMDD). None이면 가능한 전체 이력.
+            adjusted (AdjustedPriceType): 수정주가구분
+
+        Returns:
+            Dict[str, int]: 종목코드별 기록한 봉 수
+
+        Raises:
+            ChartBackfillError: 일부 종목의 동기화가 실패한 경우 모든 종목의 작업이 끝난 뒤 발생.
+                `errors`에 종목별 예외가, `counts`에 성공한 종목의 기록 수가 담깁니다.
+                성공한 종목은 저장되어 있으므로 다시 실행하면 남은 변경분만 받습니다.
+        """
+        base_date = date.today().strftime("%Y%m%d")
+        start = int(start_date) * 1_000_000 if start_date else None
+        return await self._sync(
+            stock_codes,
+            interval_key(DAILY, adjusted),
+            lambda code: self.client.chart.iter_daily_chart(code, base_date, adjusted),
+            start,
+            adjusted,
+        )
+
+    async def sync_minute(
+        self,
+        stock_codes: Iterable[str],
+        scope: MinuteScope = MinuteScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> Dict[str, int]:
+        """
+        분봉 이력을 동기화합니다 (ka10080).
+
+        Returns:
+            Dict[str, int]: 종목코드별 기록한 봉 수
+
+        Raises:
+            ChartBackfillError: 일부 종목의 동기화가 실패한 경우 (`sync_daily` 참고)
+        """
+        return await self._sync(
+            stock_codes,
+            interval_key(f"minute-{scope.value}", adjusted),
+            lambda code: self.client.chart.iter_minute_chart(code, scope, adjusted),
+            None,
+            adjusted,
+        )
+
+    async def sync_tick(
+        self,
+        stock_codes: Iterable[str],
+        scope: TickScope = TickScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> Dict[str, int]:
+        """
+        틱차트 이력을 동기화합니다 (ka10079).
+
+        Returns:
+            Dict[str, int]: 종목코드별 기록한 봉 수
+
+        Raises:
+            ChartBackfillError: 일부 종목의 동기화가 실패한 경우 (`sync_daily` 참고)
+        """
+        return await self._sync(
+            stock_codes,
+            interval_key(f"tick-{scope.value}", adjusted),
+            lambda code: self.client.chart.iter_tick_chart(code, scope, adjusted),
+            None,
+            adjusted,
+        )
+
+    async def _sync(
+        self,
+        stock_codes: Iterable[str],
+        interval: str,
+        fetch: Callable[[str], AsyncGenerator[ChartBar, None]],
+        start: Optional[int],
+        adjusted: AdjustedPriceType,
+    ) -> Dict[str, int]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        codes = list(dict.fromkeys(stock_codes))
+
+        async def sync_one(stock_code: str) -> int:
+            async with semaphore:
+                return await self._sync_symbol(stock_code, interval, fetch, start, adjusted)
+
+        # 한 종목의 실패로 다른 종목의 결과를 잃지 않도록 모든 작업이 끝날 때까지 기다립니다.
+        results = await asyncio.gather(*(sync_one(code) for code in codes), return_exceptions=True)
+        counts: Dict[str, int] = {}
+        errors: Dict[str, Exception] = {}
+        for code, result in zip(codes, results):
+            if isinstance(result, Exception):
+                errors[code] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                counts[code] = result
+        if errors:
+            raise ChartBackfillError(counts, errors)
+        return counts
+
+    async def _sync_symbol(
+        self,
+        stock_code: str,
+        interval: str,
+        fetch: Callable[[str], AsyncGenerator[ChartBar, None]],
+        start: Optional[int],
+        adjusted: AdjustedPriceType,
+    ) -> int:
+        last = self.store.last_timestamp(interval, stock_code)
+        floor = last if last is not None else start
+        rows, adjustment_event = await self._fetch_rows(stock_code, fetch, floor, last)
+
+        loop = asyncio.get_running_loop()
+        if adjusted is AdjustedPriceType.ADJUSTED and adjustment_event:
+            # 수정주가 이벤트 이후에는 이전 봉들도 새 기준으로 다시 계산되므로,
+            # 변경분만 이어 붙이지 않고 해당 종목 전체를 다시 받아 교체합니다.
+            rows, _ = await self._fetch_rows(stock_code, fetch, start, None)
+            return await loop.run_in_executor(None, self.store.replace, interval, stock_code, rows)
+
+        # 블로킹 파일 I/O가 다른 종목의 요청을 막지 않도록 스레드에서 기록합니다.
+        return await loop.run_in_executor(None, self.store.append, interval, stock_code, rows)
+
+    @staticmethod
+    async def _fetch_rows(
+        stock_code: str,
+        fetch: Callable[[str], AsyncGenerator[ChartBar, None]],
+        floor: Optional[int],
+        last: Optional[int],
+    ) -> Tuple[List[ChartRow], bool]:
+        """
+        `floor` 이후의 봉을 오름차순으로 받아 옵니다. 두 번째 값은 저장된 마지막
+        봉(`last`)보다 새로운 봉 중에 수정주가 이벤트가 있었는지 여부입니다.
+        """
+        # 응답은 최신 봉부터 오므로, 저장된 마지막 봉 이전에 도달하면 조회를 멈춥니다.
+        rows: List[ChartRow] = []
+        adjustment_event = False
+        bars = fetch(stock_code)
+        try:
+            async for bar in bars:
+                row = bar.to_row()
+                if floor is not None and row.timestamp < floor:
+                    break
+                rows.append(row)
+                if last is not None and row.timestamp > last and bar.has_adjustment_event:
+                    adjustment_event = True
+        finally:
+            await bars.aclose()
+
+        rows.reverse()
+        return rows, adjustment_event
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.chart.client
+~~~~~~~~~~~~~~~~~~~
+
+This module implements the Kiwoom chart API client.
+"""
+
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Type, Union
+
+from .models import (
+    AdjustedPriceType,
+    ChartBar,
+    DailyChartBar,
+    DailyChartResponse,
+    IntradayChartBar,
+    MinuteChartResponse,
+    MinuteScope,
+    TickChartResponse,
+    TickScope,
+)
+
+if TYPE_CHECKING:
+    from ..client import KiwoomClient
+
+ChartResponse = Union[DailyChartResponse, MinuteChartResponse, TickChartResponse]
+
+
+class ChartClient:
+    """
+    Client for Kiwoom chart API.
+
+    차트 조회 API는 최신 봉부터 과거 방향으로 응답하며, 연속조회 헤더
+    (`cont-yn`, `next-key`)를 통해 이전 구간을 이어서 조회합니다.
+    """
+
+    PATH = "/api/dostk/chart"
+
+    def __init__(self, client: "KiwoomClient"):
+        self.client = client
+
+    async def get_daily_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> DailyChartResponse:
+        """
+        주식일봉차트조회요청 (ka10081)
+
+        Args:
+            stock_code (str): 종목코드 (예: "005930")
+            base_date (str): 기준일자 (YYYYMMDD). 이 날짜부터 과거 방향으로 조회합니다.
+            adjusted (AdjustedPriceType): 수정주가구분
+
+        Returns:
+            DailyChartResponse: 첫 페이지의 일봉 차트 응답
+
+        Raises:
+            KiwoomAPIError: API 호출 실패 시 발생
+        """
+        data = {"stk_cd": stock_code, "base_dt": base_date, "upd_stkpc_tp": adjusted.value}
+        return await self.client._authenticated_post(
+            self.PATH, response_model=DailyChartResponse, headers={"api-id": "ka10081"}, json=data
+        )
+
+    async def get_minute_chart(
+        self,
+        stock_code: str,
+        scope: MinuteScope = MinuteScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> MinuteChartResponse:
+        """
+        주식분봉차트조회요청 (ka10080)
+
+        Args:
+            stock_code (str): 종목코드 (예: "005930")
+            scope (MinuteScope): 틱범위 (분 단위)
+            adjusted (AdjustedPriceType): 수정주가구분
+
+        Returns:
+            MinuteChartResponse: 첫 페이지의 분봉 차트 응답
+
+        Raises:
+            KiwoomAPIError: API 호출 실패 시 발생
+        """
+        data = {"stk_cd": stock_code, "tic_scope": scope.value, "upd_stkpc_tp": adjusted.value}
+        return await self.client._authenticated_post(
+            self.PATH, response_model=MinuteChartResponse, headers={"api-id": "ka10080"}, json=data
+        )
+
+    async def get_tick_chart(
+        self,
+        stock_code: str,
+        scope: TickScope = TickScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> TickChartResponse:
+        """
+        주식틱차트조회요청 (ka10079)
+
+        Args:
+            stock_code (str): 종목코드 (예: "005930")
+            scope (TickScope): 틱범위
+            adjusted (AdjustedPriceType): 수정주가구분
+
+        Returns:
+            TickChartResponse: 첫 페이지의 틱 차트 응답
+
+        Raises:
+            KiwoomAPIError: API 호출 실패 시 발생
+        """
+        data = {"stk_cd": stock_code, "tic_scope": scope.value, "upd_stkpc_tp": adjusted.value}
+        return await self.client._authenticated_post(
+            self.PATH, response_model=TickChartResponse, headers={"api-id": "ka10079"}, json=data
+        )
+
+    def iter_daily_chart(
+        self,
+        stock_code: str,
+        base_date: str,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> AsyncGenerator[DailyChartBar, None]:
+        """
+        주식일봉차트조회요청 (ka10081)의 모든 연속조회 페이지를 최신 봉부터 순회합니다.
+        """
+        data = {"stk_cd": stock_code, "base_dt": base_date, "upd_stkpc_tp": adjusted.value}
+        return self._iter_bars("ka10081", DailyChartResponse, data)
+
+    def iter_minute_chart(
+        self,
+        stock_code: str,
+        scope: MinuteScope = MinuteScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> AsyncGenerator[IntradayChartBar, None]:
+        """
+        주식분봉차트조회요청 (ka10080)의 모든 연속조회 페이지를 최신 봉부터 순회합니다.
+        """
+        data = {"stk_cd": stock_code, "tic_scope": scope.value, "upd_stkpc_tp": adjusted.value}
+        return self._iter_bars("ka10080", MinuteChartResponse, data)
+
+    def iter_tick_chart(
+        self,
+        stock_code: str,
+        scope: TickScope = TickScope.ONE,
+        adjusted: AdjustedPriceType = AdjustedPriceType.ADJUSTED,
+    ) -> AsyncGenerator[IntradayChartBar, None]:
+        """
+        주식틱차트조회요청 (ka10079)의 모든 연속조회 페이지를 최신 봉부터 순회합니다.
+        """
+        data = {"stk_cd": stock_code, "tic_scope": scope.value, "upd_stkpc_tp": adjusted.value}
+        return self._iter_bars("ka10079", TickChartResponse, data)
+
+    async def _iter_bars(
+        self,
+        api_id: str,
+        response_model: Type[ChartResponse],
+        data: Dict[str, Any],
+    ) -> AsyncGenerator[ChartBar, None]:
+        pages = self.client._authenticated_continuous_post(
+            self.PATH, response_model=response_model, headers={"api-id": api_id}, json=data
+        )
+        try:
+            async for page in pages:
+                for bar in page.bars:
+                    yield bar
+        finally:
+            # 호출자가 중간에 순회를 멈추면 남은 페이지를 요청하지 않도록 닫습니다.
+            await pages.aclose()
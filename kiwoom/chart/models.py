@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.chart.models
+~~~~~~~~~~~~~~~~~~~
+
+This module contains Pydantic models and enumerations for chart API requests and responses.
+"""
+
+from abc import abstractmethod
+from enum import Enum
+from typing import List, NamedTuple, Optional
+
+from pydantic import BaseModel, Field
+
+from ..models import BaseKiwoomResponse
+from ..utils import parse_int
+
+
+class AdjustedPriceType(str, Enum):
+    """수정주가구분"""
+    RAW = "0"
+    ADJUSTED = "1"
+
+
+class MinuteScope(str, Enum):
+    """분봉 틱범위"""
+    ONE = "1"
+    THREE = "3"
+    FIVE = "5"
+    TEN = "10"
+    FIFTEEN = "15"
+    THIRTY = "30"
+    FORTY_FIVE = "45"
+    SIXTY = "60"
+
+
+class TickScope(str, Enum):
+    """틱차트 틱범위"""
+    ONE = "1"
+    THREE = "3"
+    FIVE = "5"
+    TEN = "10"
+    THIRTY = "30"
+
+
+class ChartRow(NamedTuple):
+    """
+    로컬 저장소에 기록되는 차트 한 봉.
+    timestamp는 YYYYMMDDHHMMSS 형식의 정수입니다.
+    """
+    timestamp: int
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
+
+
+class ChartBar(BaseModel):
+    """차트 봉 공통 필드"""
+    current_price: str = Field(..., alias="cur_prc", description="현재가")
+    trading_volume: str = Field(..., alias="trde_qty", description="거래량")
+    opening_price: str = Field(..., alias="open_pric", description="시가")
+    high_price: str = Field(..., alias="high_pric", description="고가")
+    low_price: str = Field(..., alias="low_pric", description="저가")
+    adjusted_price_type: Optional[str] = Field(None, alias="upd_stkpc_tp", description="수정주가구분")
+    adjusted_rate: Optional[str] = Field(None, alias="upd_rt", description="수정비율")
+    previous_close_price: Optional[str] = Field(None, alias="pred_close_pric", description="전일종가")
+
+    @property
+    @abstractmethod
+    def timestamp(self) -> int:
+        """YYYYMMDDHHMMSS 형식의 봉 시각."""
+
+    @property
+    def has_adjustment_event(self) -> bool:
+        """
+        이 봉에 수정주가 이벤트(권리락, 액면분할 등)가 표시되어 있는지 여부.
+        수정주가 이력은 이벤트 이전 구간이 모두 다시 계산되므로 전체 재수집이 필요합니다.
+        """
+        if self.adjusted_price_type and self.adjusted_price_type.strip("0 "):
+            return True
+        if self.adjusted_rate:
+            try:
+                return float(self.adjusted_rate) != 0
+            except ValueError:
+                return True
+        return False
+
+    def to_row(self) -> ChartRow:
+        """부호를 제거한 정수 값으로 변환한 저장용 행을 반환합니다."""
+        return ChartRow(
+            timestamp=self.timestamp,
+            open=parse_int(self.opening_price, absolute=True),
+            high=parse_int(self.high_price, absolute=True),
+            low=parse_int(self.low_price, absolute=True),
+            close=parse_int(self.current_price, absolute=True),
+            volume=parse_int(self.trading_volume, absolute=True),
+        )
+
+
+class DailyChartBar(ChartBar):
+    """주식일봉차트 봉"""
+    date: str = Field(..., alias="dt", description="일자")
+    trading_value: Optional[str] = Field(None, alias="trde_prica", description="거래대금")
+
+    @property
+    def timestamp(self) -> int:
+        return int(self.date) * 1_000_000
+
+
+class IntradayChartBar(ChartBar):
+    """주식분봉/틱차트 봉"""
+    conclusion_time: str = Field(..., alias="cntr_tm", description="체결시간")
+
+    @property
+    def timestamp(self) -> int:
+        return int(self.conclusion_time)
+
+
+class DailyChartResponse(BaseKiwoomResponse):
+    """주식일봉차트조회 (ka10081) 응답"""
+    stock_code: str = Field(..., alias="stk_cd", description="종목코드")
+    bars: List[DailyChartBar] = Field(
+        default_factory=list, alias="stk_dt_pole_chart_qry", description="주식일봉차트조회"
+    )
+
+
+class MinuteChartResponse(BaseKiwoomResponse):
+    """주식분봉차트조회 (ka10080) 응답"""
+    stock_code: str = Field(..., alias="stk_cd", description="종목코드")
+    bars: List[IntradayChartBar] = Field(
+        default_factory=list, alias="stk_min_pole_chart_qry", description="주식분봉차트조회"
+    )
+
+
+class TickChartResponse(BaseKiwoomResponse):
+    """주식틱차트조회 (ka10079) 응답"""
+    stock_code: str = Field(..., alias="stk_cd", description="종목코드")
+    bars: List[IntradayChartBar] = Field(
+        default_factory=list, alias="stk_tic_chart_qry", description="주식틱차트조회"
+    )
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.chart.store
+~~~~~~~~~~~~~~~~~~
+
+This module implements an append-friendly local columnar store for chart history.
+
+Layout::
+
+    <root>/<interval>/<stock_code>/<partition>/<column>.i64
+
+`interval` includes the chart kind and the adjusted-price type, e.g.
+``daily-adjusted`` or ``minute-1-raw`` (see `interval_key`), so adjusted and
+raw histories of the same symbol never share files.
+
+Each column file holds native 64-bit integers, one per bar, in ascending
+timestamp order. Daily bars are partitioned by year (YYYY) and intraday bars
+(minute, tick) by trading date (YYYYMMDD), so appending new bars only ever
+touches the newest partition.
+"""
+
+import os
+import shutil
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import groupby
+from typing import Dict, List, Optional, Sequence
+
+from .models import AdjustedPriceType, ChartRow
+
+COLUMNS = ChartRow._fields
+_ITEM_SIZE = array("q").itemsize
+_SUFFIX = ".i64"
+
+DAILY = "daily"
+
+
+def interval_key(kind: str, adjusted: AdjustedPriceType) -> str:
+    """
+    차트 구분("daily", "minute-1", "tick-1" 등)과 수정주가구분으로 저장소 구간 키를 만듭니다.
+    """
+    suffix = "adjusted" if adjusted is AdjustedPriceType.ADJUSTED else "raw"
+    return f"{kind}-{suffix}"
+
+
+class ChartStore:
+    """
+    심볼과 날짜 단위로 파티션된 로컬 컬럼형 차트 저장소.
+
+    Args:
+        root (str): 저장소 최상위 디렉터리
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def last_timestamp(self, interval: str, stock_code: str) -> Optional[int]:
+        """
+        저장된 마지막 봉의 시각(YYYYMMDDHHMMSS)을 반환합니다. 저장된 봉이 없으면 None.
+        """
+        for partition in reversed(self._partitions(interval, stock_code)):
+            path = self._partition_path(interval, stock_code, partition)
+            length = self._repair(path)
+            if length:
+                with open(os.path.join(path, "timestamp" + _SUFFIX), "rb") as f:
+                    f.seek((length - 1) * _ITEM_SIZE)
+                    values = array("q")
+                    values.fromfile(f, 1)
+                    return values[0]
+        return None
+
+    def append(self, interval: str, stock_code: str, rows: Sequence[ChartRow]) -> int:
+        """
+        오름차순으로 정렬된 봉들을 저장소 끝에 추가합니다.
+
+        이미 저장된 봉 중 첫 번째 신규 봉 시각 이상인 봉은 먼저 잘라냅니다.
+        따라서 마지막 봉(예: 장중 미완성 일봉)을 다시 받아 덮어쓸 수 있습니다.
+
+        Returns:
+            int: 기록한 봉 수
+        """
+        if not rows:
+            return 0
+        self._truncate_from(interval, stock_code, rows[0].timestamp)
+
+        for partition, group in groupby(rows, key=lambda row: self._partition_of(interval, row.timestamp)):
+            path = self._partition_path(interval, stock_code, partition)
+            os.makedirs(path, exist_ok=True)
+            self._repair(path)
+            group_rows = list(group)
+            for index, column in enumerate(COLUMNS):
+                with open(os.path.join(path, column + _SUFFIX), "ab") as f:
+                    array("q", (row[index] for row in group_rows)).tofile(f)
+        return len(rows)
+
+    def replace(self, interval: str, stock_code: str, rows: Sequence[ChartRow]) -> int:
+        """
+        종목의 저장된 봉을 모두 지우고 주어진 봉으로 교체합니다.
+
+        Returns:
+            int: 기록한 봉 수
+        """
+        shutil.rmtree(os.path.join(self.root, interval, stock_code), ignore_errors=True)
+        return self.append(interval, stock_code, rows)
+
+    def read(
+        self,
+        interval: str,
+        stock_code: str,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Dict[str, array]:
+        """
+        저장된 봉을 컬럼별 배열로 읽습니다.
+
+        Args:
+            interval (str): 구간 키 (예: "daily-adjusted", "minute-1-raw")
+            stock_code (str): 종목코드
+            start (Optional[int]): 포함할 최소 시각 (YYYYMMDDHHMMSS)
+            end (Optional[int]): 포함할 최대 시각 (YYYYMMDDHHMMSS)
+
+        Returns:
+            Dict[str, array]: 컬럼 이름별 int64 배열
+        """
+        result = {column: array("q") for column in COLUMNS}
+        for partition in self._partitions(interval, stock_code):
+            if start is not None and partition < self._partition_of(interval, start):
+                continue
+            if end is not None and partition > self._partition_of(interval, end):
+                break
+            path = self._partition_path(interval, stock_code, partition)
+            length = self._repair(path)
+            columns = {column: self._read_column(path, column, length) for column in COLUMNS}
+            timestamps = columns["timestamp"]
+            lo = 0 if start is None else bisect_left(timestamps, start)
+            hi = length if end is None else bisect_right(timestamps, end)
+            for column in COLUMNS:
+                result[column].extend(columns[column][lo:hi])
+        return result
+
+    def stock_codes(self, interval: str) -> List[str]:
+        """해당 차트 구분으로 저장된 종목코드 목록을 반환합니다."""
+        path = os.path.join(self.root, interval)
+        if not os.path.isdir(path):
+            return []
+        return sorted(os.listdir(path))
+
+    @staticmethod
+    def _partition_of(interval: str, timestamp: int) -> str:
+        if interval.split("-", 1)[0] == DAILY:
+            return str(timestamp // 10_000_000_000)
+        return str(timestamp // 1_000_000)
+
+    def _partition_path(self, interval: str, stock_code: str, partition: str) -> str:
+        return os.path.join(self.root, interval, stock_code, partition)
+
+    def _partitions(self, interval: str, stock_code: str) -> List[str]:
+        path = os.path.join(self.root, interval, stock_code)
+        if not os.path.isdir(path):
+            return []
+        return sorted(os.listdir(path))
+
+    @staticmethod
+    def _read_column(path: str, column: str, length: int) -> array:
+        values = array("q")
+        with open(os.path.join(path, column + _SUFFIX), "rb") as f:
+            values.fromfile(f, length)
+        return values
+
+    @staticmethod
+    def _repair(path: str) -> int:
+        """
+        파티션의 컬럼 길이를 가장 짧은 컬럼에 맞춰 정리하고 봉 수를 반환합니다.
+        기록 도중 중단되어 일부 컬럼만 길어진 경우를 복구합니다.
+        """
+        files = [os.path.join(path, column + _SUFFIX) for column in COLUMNS]
+        sizes = [os.path.getsize(file) if os.path.exists(file) else 0 for file in files]
+        length = min(sizes) // _ITEM_SIZE
+        for file, size in zip(files, sizes):
+            if size != length * _ITEM_SIZE:
+                with open(file, "ab") as f:
+                    f.truncate(length * _ITEM_SIZE)
+        return length
+
+    def _truncate_from(self, interval: str, stock_code: str, timestamp: int) -> None:
+        for partition in reversed(self._partitions(interval, stock_code)):
+            path = self._partition_path(interval, stock_code, partition)
+            length = self._repair(path)
+            timestamps = self._read_column(path, "timestamp", length)
+            keep = bisect_left(timestamps, timestamp)
+            if keep == length:
+                return
+            for column in COLUMNS:
+                with open(os.path.join(path, column + _SUFFIX), "ab") as f:
+                    f.truncate(keep * _ITEM_SIZE)
+            if keep:
+                return
+
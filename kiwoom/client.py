@@ -12,6 +12,8 @@ from typing import Optional
 import httpx
 from dotenv import load_dotenv
 
+from .chart.client import ChartClient
+from .concurrency import AdaptiveConcurrencyLimiter
 from .core import AuthenticatedKiwoomBaseClient
 from .exceptions import AuthenticationError
 from .models import AuthResponse
@@ -29,6 +31,7 @@ class KiwoomClient(AuthenticatedKiwoomBaseClient):
         app_secret: Optional[str] = None,
         api_server_type: Optional[str] = None,
         access_token: Optional[str] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         load_dotenv()  # Load environment variables from .env file
 
@@ -58,8 +61,10 @@ class KiwoomClient(AuthenticatedKiwoomBaseClient):
             client=self._client,
             websocket_url=websocket_url,
             access_token=access_token,
+            limiter=limiter or AdaptiveConcurrencyLimiter(),
         )
         self.stock_information = StockInformationClient(client=self)
+        self.chart = ChartClient(client=self)
 
     async def fetch_access_token(self):
         """
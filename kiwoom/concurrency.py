@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.concurrency
+~~~~~~~~~~~~~~~~~~
+
+This module implements adaptive concurrency control for Kiwoom API requests.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, FrozenSet, Iterable, Optional
+
+import httpx
+
+from .exceptions import KiwoomAPIError
+
+#: 키움 API가 요청 한도 초과 시 돌려주는 return_code
+THROTTLE_RETURN_CODES: FrozenSet[int] = frozenset({5})
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD 방식으로 동시 요청 수를 조절하는 리미터.
+
+    응답 지연시간이 관측된 최소 지연시간 대비 안정적으로 유지되는 동안에는
+    한도를 가산적으로 늘리고(additive increase), 지연시간이 상승하거나
+    스로틀(return_code) 또는 HTTP 429/5xx 응답이 관측되면 한도를
+    곱셈적으로 줄입니다(multiplicative decrease). 요청 타임아웃(연결 풀 대기
+    타임아웃 포함)도 과부하 신호로 간주합니다.
+
+    Args:
+        initial_limit (int): 초기 동시 요청 한도
+        min_limit (int): 최소 동시 요청 한도
+        max_limit (int): 최대 동시 요청 한도
+        backoff_ratio (float): 한도 감소 시 곱하는 비율 (0 < ratio < 1)
+        latency_tolerance (float): 최소 지연시간 대비 허용 배수.
+            평활 지연시간이 이 배수를 넘으면 혼잡으로 간주합니다.
+        smoothing (float): 지연시간 지수이동평균 가중치 (0 < smoothing <= 1)
+        baseline_drift (float): 최소 지연시간이 최근 관측값 쪽으로 따라가는 비율.
+            네트워크 환경이 바뀌어 기준 지연시간이 올라간 경우에도 한도가
+            최소값에 고정되지 않도록 합니다.
+        throttle_codes (Iterable[int]): 스로틀로 간주할 API return_code 목록
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_drift: float = 0.01,
+        throttle_codes: Iterable[int] = THROTTLE_RETURN_CODES,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("min_limit <= initial_limit <= max_limit must hold and be >= 1.")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.baseline_drift = baseline_drift
+        self.throttle_codes = frozenset(throttle_codes)
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._min_latency: Optional[float] = None
+        self._smoothed_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 요청 한도."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """현재 진행 중인 요청 수."""
+        return self._in_flight
+
+    @property
+    def smoothed_latency(self) -> Optional[float]:
+        """평활된 응답 지연시간(초). 관측값이 없으면 None."""
+        return self._smoothed_latency
+
+    @property
+    def min_latency(self) -> Optional[float]:
+        """관측된 최소 응답 지연시간(초). 관측값이 없으면 None."""
+        return self._min_latency
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        요청 하나를 위한 슬롯을 확보합니다.
+
+        슬롯 내부에서 발생한 결과(성공, 스로틀, 기타 오류)와 지연시간을
+        관측하여 동시 요청 한도를 갱신합니다.
+        """
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        start = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if self.is_overload(e):
+                self._on_overload(start)
+            await self._release()
+            raise
+        except BaseException:
+            await self._release()
+            raise
+        else:
+            self._on_success(time.monotonic() - start)
+            await self._release()
+
+    def is_overload(self, error: BaseException) -> bool:
+        """
+        서버 과부하(스로틀, HTTP 429/5xx, 타임아웃)로 인한 오류인지 판별합니다.
+
+        `KiwoomAPIError`로 감싸진 전송 오류는 `__cause__`를 확인합니다.
+        """
+        if isinstance(error, httpx.TimeoutException) or isinstance(
+            error.__cause__, httpx.TimeoutException
+        ):
+            return True
+        if not isinstance(error, KiwoomAPIError):
+            return False
+        if error.error_code is not None:
+            try:
+                if int(error.error_code) in self.throttle_codes:
+                    return True
+            except (TypeError, ValueError):
+                pass
+        status_code = getattr(error.response, "status_code", None)
+        return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+    def _get_condition(self) -> asyncio.Condition:
+        # 이벤트 루프 밖에서 생성될 수 있으므로 최초 사용 시점에 만듭니다.
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _on_success(self, latency: float) -> None:
+        if self._min_latency is None or latency < self._min_latency:
+            self._min_latency = latency
+        else:
+            self._min_latency += self.baseline_drift * (latency - self._min_latency)
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += self.smoothing * (latency - self._smoothed_latency)
+
+        if self._smoothed_latency > self._min_latency * self.latency_tolerance:
+            self._decrease()
+        elif self._in_flight >= self.limit:
+            # 한도를 모두 사용 중일 때만 늘려서, 한 번의 왕복마다 약 1씩 증가시킵니다.
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+
+    def _on_overload(self, started: float) -> None:
+        # 마지막 감소 이전에 시작된 요청은 이미 반영된 혼잡 구간에 속하므로,
+        # 지연시간 관측값이 없는 시작 직후에도 한 구간에 한 번만 줄입니다.
+        if started < self._last_decrease:
+            return
+        self._decrease()
+
+    def _decrease(self) -> None:
+        # 같은 혼잡 구간에서 발생한 연속된 신호로 한도가 과도하게 줄지 않도록,
+        # 평활 지연시간 한 번 동안은 추가 감소를 하지 않습니다.
+        now = time.monotonic()
+        if now - self._last_decrease < (self._smoothed_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        if self._smoothed_latency is not None and self._min_latency is not None:
+            # 감소 후에는 기준선을 다시 잡도록 평활값을 최소값 쪽으로 되돌립니다.
+            self._smoothed_latency = self._min_latency
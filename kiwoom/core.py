@@ -7,12 +7,13 @@ This module provides the core functionality for interacting with the Kiwoom API.
 """
 
 import asyncio
-from typing import Any, AsyncGenerator, Callable, Coroutine, Dict, Optional, Type, TypeVar
+from typing import Any, AsyncGenerator, Callable, Coroutine, Dict, Optional, Tuple, Type, TypeVar
 
 import httpx
 import websockets
 from pydantic import ValidationError
 
+from .concurrency import AdaptiveConcurrencyLimiter
 from .exceptions import KiwoomAPIError, WebSocketError, AuthenticationError
 from .models import BaseKiwoomResponse, PaginatedResponse # Changed APIResponse to BaseKiwoomResponse
 
@@ -29,10 +30,19 @@ class KiwoomBaseClient:
         base_url: str,
         client: httpx.AsyncClient,
         websocket_url: str,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
         self.base_url = base_url
         self._client = client
         self.websocket_url = websocket_url
+        self._limiter = limiter
+
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        """
+        The current adaptive concurrency limit, or None when no limiter is configured.
+        """
+        return self._limiter.limit if self._limiter is not None else None
 
     async def _request(
         self,
@@ -47,7 +57,47 @@ class KiwoomBaseClient:
         """
         Sends an HTTP request and processes the response.
         """
+        result, _ = await self._request_with_headers(
+            method, path, response_model, params=params, data=data, json=json, headers=headers
+        )
+        return result
+
+    async def _request_with_headers(
+        self,
+        method: str,
+        path: str,
+        response_model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[T, httpx.Headers]:
+        """
+        Sends an HTTP request and returns the parsed response with its headers.
+        When a concurrency limiter is configured, the request waits for a free slot
+        and its outcome is reported back to the limiter.
+        """
+        if self._limiter is None:
+            return await self._send(
+                method, path, response_model, params=params, data=data, json=json, headers=headers
+            )
+        async with self._limiter.slot():
+            return await self._send(
+                method, path, response_model, params=params, data=data, json=json, headers=headers
+            )
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        response_model: Type[T],
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[T, httpx.Headers]:
         url = f"{self.base_url}{path}"
+        response = None
         try:
             response = await self._client.request(
                 method, url, params=params, data=data, json=json, headers=headers
@@ -65,7 +115,9 @@ class KiwoomBaseClient:
                     error_message=json_data.get("return_msg"),
                 )
 
-            return response_model.model_validate(json_data)
+            return response_model.model_validate(json_data), response.headers
+        except KiwoomAPIError:
+            raise
         except httpx.HTTPStatusError as e:
             # print(f"HTTP Status Error: {e.response.status_code} - {e.response.text}") # Debugging line removed
             raise KiwoomAPIError(response=e.response) from e
@@ -156,8 +208,9 @@ class AuthenticatedKiwoomBaseClient(KiwoomBaseClient):
         client: httpx.AsyncClient,
         websocket_url: str,
         access_token: Optional[str] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
     ):
-        super().__init__(base_url, client, websocket_url)
+        super().__init__(base_url, client, websocket_url, limiter=limiter)
         self._access_token = access_token
 
     @property
@@ -223,3 +276,32 @@ class AuthenticatedKiwoomBaseClient(KiwoomBaseClient):
         return await self._authenticated_request(
             "POST", path, response_model, data=data, json=json, headers=headers
         )
+
+    async def _authenticated_continuous_post(
+        self,
+        path: str,
+        response_model: Type[T],
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncGenerator[T, None]:
+        """
+        Sends a continuous (연속조회) authenticated POST request, yielding each page.
+        The `cont-yn` and `next-key` response headers are echoed back on the next
+        request until the server reports there is no more data.
+        """
+        page_headers = dict(headers or {})
+        while True:
+            page, response_headers = await self._request_with_headers(
+                "POST",
+                path,
+                response_model,
+                json=json,
+                headers={**self._auth_headers, **page_headers},
+            )
+            yield page
+
+            next_key = response_headers.get("next-key")
+            if response_headers.get("cont-yn") != "Y" or not next_key:
+                break
+            page_headers["cont-yn"] = "Y"
+            page_headers["next-key"] = next_key
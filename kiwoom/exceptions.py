@@ -27,6 +27,21 @@ class KiwoomAPIError(KiwoomException):
         super().__init__(f"[{self.error_code}] {self.error_message}")
 
 
+class ChartBackfillError(KiwoomException):
+    """Indicates that some symbols failed during a chart history sync.
+
+    Attributes:
+        counts: Number of bars written per symbol that synced successfully.
+        errors: The exception raised per symbol that failed.
+    """
+
+    def __init__(self, counts: dict, errors: dict):
+        self.counts = counts
+        self.errors = errors
+        failed = ", ".join(f"{code}: {error}" for code, error in errors.items())
+        super().__init__(f"{len(errors)} symbol(s) failed to sync ({failed})")
+
+
 class AuthenticationError(KiwoomException):
     """Indicates an authentication error."""
 
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.screener
+~~~~~~~~~~~~~~~
+
+This package contains the market-wide live screener.
+"""
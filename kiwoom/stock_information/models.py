@@ -6,7 +6,7 @@ kiwoom.stock_information.models
 This module contains Pydantic models for stock information API requests and responses.
 """
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -78,3 +78,38 @@ class StockInfo(BaseKiwoomResponse):
     face_value_unit: Optional[str] = Field(None, alias="fav_unit", description="액면가단위")
     circulating_shares: Optional[str] = Field(None, alias="dstr_stk", description="유통주식")
     circulation_ratio: Optional[str] = Field(None, alias="dstr_rt", description="유통비율")
+
+class WatchlistStockInfo(BaseModel):
+    """관심종목정보 (종목별)"""
+    stock_code: str = Field(..., alias="stk_cd", description="종목코드")
+    stock_name: Optional[str] = Field(None, alias="stk_nm", description="종목명")
+    current_price: Optional[str] = Field(None, alias="cur_prc", description="현재가")
+    standard_price: Optional[str] = Field(None, alias="base_pric", description="기준가")
+    previous_day_comparison: Optional[str] = Field(None, alias="pred_pre", description="전일대비")
+    comparison_symbol: Optional[str] = Field(None, alias="pre_sig", description="전일대비기호")
+    fluctuation_rate: Optional[str] = Field(None, alias="flu_rt", description="등락율")
+    trading_volume: Optional[str] = Field(None, alias="trde_qty", description="거래량")
+    trading_value: Optional[str] = Field(None, alias="trde_prica", description="거래대금")
+    conclusion_quantity: Optional[str] = Field(None, alias="cntr_qty", description="체결량")
+    conclusion_strength: Optional[str] = Field(None, alias="cntr_str", description="체결강도")
+    sell_bid: Optional[str] = Field(None, alias="sel_bid", description="매도호가")
+    buy_bid: Optional[str] = Field(None, alias="buy_bid", description="매수호가")
+    upper_limit_price: Optional[str] = Field(None, alias="upl_pric", description="상한가")
+    lower_limit_price: Optional[str] = Field(None, alias="lst_pric", description="하한가")
+    opening_price: Optional[str] = Field(None, alias="open_pric", description="시가")
+    high_price: Optional[str] = Field(None, alias="high_pric", description="고가")
+    low_price: Optional[str] = Field(None, alias="low_pric", description="저가")
+    closing_price: Optional[str] = Field(None, alias="close_pric", description="종가")
+    conclusion_time: Optional[str] = Field(None, alias="cntr_tm", description="체결시간")
+    expected_conclusion_price: Optional[str] = Field(None, alias="exp_cntr_pric", description="예상체결가")
+    expected_conclusion_quantity: Optional[str] = Field(None, alias="exp_cntr_qty", description="예상체결량")
+    capital: Optional[str] = Field(None, alias="cap", description="자본금")
+    face_value: Optional[str] = Field(None, alias="fav", description="액면가")
+    market_cap: Optional[str] = Field(None, alias="mac", description="시가총액")
+    listed_shares: Optional[str] = Field(None, alias="stkcnt", description="주식수")
+
+class WatchlistInfoResponse(BaseKiwoomResponse):
+    """관심종목정보요청 (ka10095) 응답"""
+    stocks: List[WatchlistStockInfo] = Field(
+        default_factory=list, alias="atn_stk_infr", description="관심종목정보"
+    )
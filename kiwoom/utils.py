@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+kiwoom.utils
+~~~~~~~~~~~~
+
+This module contains helpers for converting Kiwoom API string values.
+"""
+
+from typing import Optional
+
+
+def parse_int(value: Optional[str], absolute: bool = False) -> int:
+    """
+    키움 API의 숫자 문자열을 정수로 변환합니다.
+
+    가격 필드는 등락 방향을 나타내는 부호("+70100", "-69500")가 붙어 오므로,
+    `absolute=True`로 부호를 제거한 값을 얻을 수 있습니다.
+
+    Args:
+        value (Optional[str]): 변환할 문자열. 빈 문자열이나 None은 0으로 처리합니다.
+        absolute (bool): 부호를 제거한 절대값을 반환할지 여부
+
+    Returns:
+        int: 변환된 정수
+    """
+    if not value:
+        return 0
+    number = int(value.replace(",", ""))
+    return abs(number) if absolute else number
+
+
+def parse_float(value: Optional[str], absolute: bool = False) -> float:
+    """
+    키움 API의 숫자 문자열을 실수로 변환합니다.
+
+    Args:
+        value (Optional[str]): 변환할 문자열. 빈 문자열이나 None은 NaN으로 처리합니다.
+        absolute (bool): 부호를 제거한 절대값을 반환할지 여부
+
+    Returns:
+        float: 변환된 실수
+    """
+    if not value:
+        return float("nan")
+    number = float(value.replace(",", ""))
+    return abs(number) if absolute else number
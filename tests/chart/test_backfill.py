@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+tests.chart.test_backfill
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for the chart backfill engine and local store.
+"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from kiwoom.chart.backfill import ChartBackfillEngine
+from kiwoom.chart.models import AdjustedPriceType, ChartBar, ChartRow, DailyChartBar
+from kiwoom.chart.store import DAILY, ChartStore, interval_key
+from kiwoom.client import KiwoomClient
+from kiwoom.exceptions import ChartBackfillError, KiwoomAPIError
+
+
+def _bar(dt: str, close: int, adjusted_rate: str = "") -> DailyChartBar:
+    return DailyChartBar.model_validate(
+        {
+            "cur_prc": str(close),
+            "trde_qty": "100",
+            "dt": dt,
+            "open_pric": str(close),
+            "high_pric": str(close),
+            "low_pric": str(close),
+            "upd_rt": adjusted_rate,
+        }
+    )
+
+
+def _history(bars):
+    """Returns a fake iter_daily_chart yielding bars newest first, recording pulls."""
+    pulled = []
+
+    def iter_daily_chart(stock_code, base_date, adjusted):
+        async def gen():
+            for bar in sorted(bars[stock_code], key=lambda b: b.date, reverse=True):
+                pulled.append((stock_code, bar.date))
+                yield bar
+
+        return gen()
+
+    return iter_daily_chart, pulled
+
+
+def test_store_append_and_read_across_partitions(tmp_path):
+    """
+    Test rows are split into yearly partitions and read back in order.
+    """
+    store = ChartStore(str(tmp_path))
+    rows = [
+        ChartRow(20231228000000, 1, 1, 1, 1, 10),
+        ChartRow(20240102000000, 2, 2, 2, 2, 20),
+        ChartRow(20240103000000, 3, 3, 3, 3, 30),
+    ]
+
+    assert store.append(DAILY, "005930", rows) == 3
+
+    assert sorted((tmp_path / DAILY / "005930").iterdir())[0].name == "2023"
+    assert store.last_timestamp(DAILY, "005930") == 20240103000000
+    assert list(store.read(DAILY, "005930")["close"]) == [1, 2, 3]
+    assert list(store.read(DAILY, "005930", start=20240101000000)["volume"]) == [20, 30]
+
+    # 같은 시각의 봉을 다시 추가하면 덮어씁니다.
+    store.append(DAILY, "005930", [ChartRow(20240103000000, 3, 4, 3, 4, 40)])
+    assert list(store.read(DAILY, "005930")["close"]) == [1, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_sync_daily_fetches_only_delta(tmp_path, mocker: MockerFixture):
+    """
+    Test the second sync only pulls bars from the last stored bar onwards.
+    """
+    client = mocker.MagicMock(spec=KiwoomClient)
+    client.chart = mocker.MagicMock()
+    history = {
+        "005930": [_bar("20240102", 100), _bar("20240103", 101)],
+        "000660": [_bar("20240103", 200)],
+    }
+    client.chart.iter_daily_chart, pulled = _history(history)
+    store = ChartStore(str(tmp_path))
+    engine = ChartBackfillEngine(client, store, max_concurrency=2)
+
+    assert await engine.sync_daily(["005930", "000660"]) == {"005930": 2, "000660": 1}
+
+    history["005930"] += [_bar("20240104", 102), _bar("20240105", 103)]
+    pulled.clear()
+    assert await engine.sync_daily(["005930"]) == {"005930": 3}
+
+    assert pulled == [("005930", "20240105"), ("005930", "20240104"), ("005930", "20240103"), ("005930", "20240102")]
+    adjusted_key = interval_key(DAILY, AdjustedPriceType.ADJUSTED)
+    assert list(store.read(adjusted_key, "005930")["close"]) == [100, 101, 102, 103]
+    assert store.last_timestamp(interval_key(DAILY, AdjustedPriceType.RAW), "005930") is None
+
+
+@pytest.mark.asyncio
+async def test_sync_daily_rebackfills_after_adjustment_event(tmp_path, mocker: MockerFixture):
+    """
+    Test an adjustment event in the delta replaces the symbol's stored adjusted history.
+    """
+    client = mocker.MagicMock(spec=KiwoomClient)
+    client.chart = mocker.MagicMock()
+    history = {"005930": [_bar("20240102", 1000), _bar("20240103", 1010)]}
+    client.chart.iter_daily_chart, _ = _history(history)
+    store = ChartStore(str(tmp_path))
+    engine = ChartBackfillEngine(client, store)
+    await engine.sync_daily(["005930"])
+    await engine.sync_daily(["005930"], adjusted=AdjustedPriceType.RAW)
+
+    # 1:10 액면분할 이후 과거 봉들도 새 기준으로 다시 계산됩니다.
+    history["005930"] = [_bar("20240102", 100), _bar("20240103", 101), _bar("20240104", 102, "+0.10")]
+    assert await engine.sync_daily(["005930"]) == {"005930": 3}
+
+    adjusted_key = interval_key(DAILY, AdjustedPriceType.ADJUSTED)
+    assert list(store.read(adjusted_key, "005930")["close"]) == [100, 101, 102]
+    raw_key = interval_key(DAILY, AdjustedPriceType.RAW)
+    assert list(store.read(raw_key, "005930")["close"]) == [1000, 1010]
+
+
+@pytest.mark.asyncio
+async def test_sync_daily_reports_failed_symbols_after_all_finish(tmp_path, mocker: MockerFixture):
+    """
+    Test one failing symbol does not lose the results of the others.
+    """
+    client = mocker.MagicMock(spec=KiwoomClient)
+    client.chart = mocker.MagicMock()
+    iter_daily_chart, _ = _history({"005930": [_bar("20240102", 100)], "000660": [_bar("20240102", 200)]})
+
+    def fetch(stock_code, base_date, adjusted):
+        if stock_code == "999999":
+            raise KiwoomAPIError(response=None, error_code="1", error_message="유효하지 않은 종목코드입니다")
+        return iter_daily_chart(stock_code, base_date, adjusted)
+
+    client.chart.iter_daily_chart = fetch
+    store = ChartStore(str(tmp_path))
+    engine = ChartBackfillEngine(client, store, max_concurrency=1)
+
+    with pytest.raises(ChartBackfillError) as excinfo:
+        await engine.sync_daily(["999999", "005930", "000660"])
+
+    assert excinfo.value.counts == {"005930": 1, "000660": 1}
+    assert list(excinfo.value.errors) == ["999999"]
+    assert isinstance(excinfo.value.errors["999999"], KiwoomAPIError)
+    assert store.last_timestamp(interval_key(DAILY, AdjustedPriceType.ADJUSTED), "000660") == 20240102000000
+
+
+def test_chart_bar_timestamp_is_abstract():
+    """
+    Test the shared ChartBar base cannot be instantiated without a timestamp.
+    """
+    with pytest.raises(TypeError):
+        ChartBar.model_validate(
+            {"cur_prc": "1", "trde_qty": "1", "open_pric": "1", "high_pric": "1", "low_pric": "1"}
+        )
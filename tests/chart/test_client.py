@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+tests.chart.test_client
+~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for the Kiwoom chart API client.
+"""
+
+import httpx
+import pytest
+from httpx import Response
+from pytest_mock import MockerFixture
+
+from kiwoom.chart.client import ChartClient
+from kiwoom.chart.models import AdjustedPriceType, ChartRow, DailyChartResponse
+from kiwoom.client import KiwoomClient
+from kiwoom.core import AuthenticatedKiwoomBaseClient
+
+
+@pytest.fixture
+def mock_kiwoom_client(mocker: MockerFixture):
+    """Fixture to mock KiwoomClient."""
+    mock_client = mocker.MagicMock(spec=KiwoomClient)
+    mock_client.access_token = "test_token"
+    return mock_client
+
+
+def _daily_page(bars, cont_yn="N", next_key=""):
+    return Response(
+        status_code=200,
+        json={
+            "stk_cd": "005930",
+            "stk_dt_pole_chart_qry": bars,
+            "return_code": 0,
+            "return_msg": "정상적으로 처리되었습니다",
+        },
+        headers={"cont-yn": cont_yn, "next-key": next_key, "api-id": "ka10081"},
+        request=httpx.Request("POST", "http://test.com/api/dostk/chart"),
+    )
+
+
+def _daily_bar(dt, close):
+    return {
+        "cur_prc": close,
+        "trde_qty": "9263135",
+        "trde_prica": "648525",
+        "dt": dt,
+        "open_pric": "69500",
+        "high_pric": "+70600",
+        "low_pric": "-69400",
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_daily_chart(mock_kiwoom_client: KiwoomClient):
+    """
+    Test get_daily_chart sends ka10081 with the expected body.
+    """
+    mock_kiwoom_client._authenticated_post.return_value = DailyChartResponse.model_validate(
+        _daily_page([_daily_bar("20241105", "70100")]).json()
+    )
+    chart_client = ChartClient(client=mock_kiwoom_client)
+
+    response = await chart_client.get_daily_chart("005930", "20241108", AdjustedPriceType.ADJUSTED)
+
+    mock_kiwoom_client._authenticated_post.assert_called_once_with(
+        "/api/dostk/chart",
+        response_model=DailyChartResponse,
+        headers={"api-id": "ka10081"},
+        json={"stk_cd": "005930", "base_dt": "20241108", "upd_stkpc_tp": "1"},
+    )
+    assert response.bars[0].to_row() == ChartRow(20241105000000, 69500, 70600, 69400, 70100, 9263135)
+
+
+@pytest.mark.asyncio
+async def test_iter_daily_chart_follows_continuation_headers(mocker: MockerFixture):
+    """
+    Test iter_daily_chart walks every page using the cont-yn/next-key headers.
+    """
+    http_client = mocker.MagicMock(spec=httpx.AsyncClient)
+    http_client.request = mocker.AsyncMock(
+        side_effect=[
+            _daily_page([_daily_bar("20241105", "70100"), _daily_bar("20241104", "-69000")], "Y", "KEY1"),
+            _daily_page([_daily_bar("20241101", "+68000")]),
+        ]
+    )
+    client = AuthenticatedKiwoomBaseClient("http://test.com", http_client, "ws://test.com", "test_token")
+    chart_client = ChartClient(client=client)
+
+    dates = [bar.date async for bar in chart_client.iter_daily_chart("005930", "20241108")]
+
+    assert dates == ["20241105", "20241104", "20241101"]
+    second_headers = http_client.request.call_args_list[1].kwargs["headers"]
+    assert second_headers["cont-yn"] == "Y"
+    assert second_headers["next-key"] == "KEY1"
+    assert second_headers["api-id"] == "ka10081"
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+tests.screener.test_screener
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for the live screener.
+"""
+
+import json
+
+import pytest
+
+from kiwoom.screener.screener import MembershipChange, Screen, Screener
+from kiwoom.stock_information.models import StockInfo
+
+_BASE = {
+    "mrkt_type": "KOSPI",
+    "setl_mm": "12",
+    "fav": "100",
+    "cap": "1311",
+    "flo_stk": "25527",
+    "crd_rt": "+0.08",
+    "oyr_hgst": "+181400",
+    "oyr_lwst": "-91200",
+    "mac": "24352",
+    "mac_wght": "",
+    "for_exh_rt": "0.00",
+    "repl_pric": "66780",
+    "bps": "75300",
+    "sale_amt": "0",
+    "bus_pro": "0",
+    "cup_nga": "0",
+    "250hgst": "+124000",
+    "250lwst": "-66800",
+    "open_pric": "0",
+    "high_pric": "0",
+    "low_pric": "0",
+    "upl_pric": "0",
+    "lst_pric": "0",
+    "base_pric": "0",
+    "exp_cntr_pric": "0",
+    "exp_cntr_qty": "0",
+    "250hgst_pric_dt": "20240101",
+    "250hgst_pric_pre_rt": "0",
+    "250lwst_pric_dt": "20240101",
+    "250lwst_pric_pre_rt": "0",
+    "return_code": 0,
+    "return_msg": "정상적으로 처리되었습니다",
+}
+
+
+def _stock(code: str, price: str, rate: str) -> StockInfo:
+    return StockInfo(**_BASE, stk_cd=code, stk_nm=code, cur_prc=price, flu_rt=rate)
+
+
+@pytest.fixture
+def screener():
+    screener = Screener()
+    screener.load_snapshot(
+        [_stock("000001", "1000", "+1.00"), _stock("000002", "-2000", "-3.00"), _stock("000003", "+3000", "+5.00")]
+    )
+    return screener
+
+
+def test_filter_screen_reports_entries_and_exits(screener: Screener):
+    """
+    Test a filter screen only emits changes for the updated symbol.
+    """
+    events = []
+    screener.subscribe(events.append)
+    screener.add_screen(Screen("gainers", lambda row: row["fluctuation_rate"] > 2, columns=["fluctuation_rate"]))
+    assert events == [MembershipChange("gainers", "000003", True)]
+
+    events.clear()
+    assert screener.apply_update("000001", {"10": "+1100", "12": "+3.50"}) == [
+        MembershipChange("gainers", "000001", True)
+    ]
+    screener.apply_update("000003", {"12": "+1.00"})
+    screener.apply_update("000002", {"10": "-1990"})
+
+    assert events == [MembershipChange("gainers", "000001", True), MembershipChange("gainers", "000003", False)]
+    assert screener.members("gainers") == {"000001"}
+
+
+def test_ranked_screen_swaps_symbols_at_the_boundary(screener: Screener):
+    """
+    Test a top-N screen swaps exactly one member in and out when the order changes.
+    """
+    screener.add_screen(
+        Screen("top2", lambda row: True, rank_key=lambda row: row["current_price"], limit=2)
+    )
+    assert screener.ranking("top2") == ["000003", "000002"]
+
+    changes = screener.apply_update("000001", {"10": "+2500"})
+
+    assert changes == [MembershipChange("top2", "000001", True), MembershipChange("top2", "000002", False)]
+    assert screener.ranking("top2") == ["000003", "000001"]
+
+    changes = screener.apply_update("000003", {"10": "-100"})
+
+    assert changes == [MembershipChange("top2", "000003", False), MembershipChange("top2", "000002", True)]
+    assert screener.members("top2") == {"000001", "000002"}
+
+
+@pytest.mark.asyncio
+async def test_handle_message_applies_real_time_updates(screener: Screener):
+    """
+    Test REAL WebSocket messages are applied to the table.
+    """
+    message = json.dumps(
+        {
+            "trnm": "REAL",
+            "data": [
+                {"type": "0B", "name": "주식체결", "item": "000002", "values": {"10": "-2100", "13": "500"}},
+                {"type": "0H", "name": "주식예상체결", "item": "000002", "values": {"10": "-9999"}},
+            ],
+        }
+    )
+
+    await screener.handle_message(message)
+    await screener.handle_message(json.dumps({"trnm": "PING"}))
+
+    row = screener.table.row("000002")
+    assert row["current_price"] == 2100
+    assert row["trading_volume"] == 500
+
+
+def test_loading_publishes_only_the_final_membership():
+    """
+    Test adding a screen and loading a snapshot publish only the net membership change.
+    """
+    screener = Screener()
+    events = []
+    screener.subscribe(events.append)
+    screener.add_screen(Screen("top1", lambda row: True, rank_key=lambda row: row["current_price"], limit=1))
+    assert events == []
+
+    screener.load_snapshot(
+        [_stock("000001", "1000", "+1.00"), _stock("000002", "-2000", "-3.00"), _stock("000003", "+3000", "+5.00")]
+    )
+    assert events == [MembershipChange("top1", "000003", True)]
+
+    events.clear()
+    screener.load_snapshot([_stock("000001", "4000", "+1.00"), _stock("000003", "+3000", "+5.00")])
+    assert events == [MembershipChange("top1", "000003", False), MembershipChange("top1", "000001", True)]
+    assert screener.ranking("top1") == ["000001"]
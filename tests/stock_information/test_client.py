@@ -6,6 +6,8 @@ tests.stock_information.test_client
 This module contains unit tests for the Kiwoom stock information API client.
 """
 
+import asyncio
+
 import pytest
 import httpx
 from httpx import Response
@@ -14,7 +16,7 @@ from pytest_mock import MockerFixture
 from kiwoom.client import KiwoomClient
 from kiwoom.exceptions import KiwoomAPIError
 from kiwoom.stock_information.client import StockInformationClient
-from kiwoom.stock_information.models import StockInfo
+from kiwoom.stock_information.models import StockInfo, WatchlistInfoResponse
 
 @pytest.fixture
 def mock_kiwoom_client(mocker: MockerFixture):
@@ -125,3 +127,54 @@ async def test_get_stock_basic_info_api_error(stock_info_client: StockInformatio
     )
     assert "잘못된 종목코드입니다." in str(excinfo.value)
     assert "[-1]" in str(excinfo.value)
+
+@pytest.mark.asyncio
+async def test_get_stock_basic_info_merges_concurrent_identical_calls(stock_info_client: StockInformationClient, mock_kiwoom_client: KiwoomClient, mocker: MockerFixture):
+    """
+    Test concurrent get_stock_basic_info calls for the same code share one request.
+    """
+    response = mocker.MagicMock(spec=StockInfo)
+    response.return_code = 0
+
+    async def slow_post(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return response
+
+    mock_kiwoom_client._authenticated_post.side_effect = slow_post
+
+    results = await asyncio.gather(
+        *(stock_info_client.get_stock_basic_info(code) for code in ["005930", "005930", "000660", "005930"])
+    )
+
+    assert all(result is response for result in results)
+    assert mock_kiwoom_client._authenticated_post.call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_watchlist_stock_info_batches_concurrent_calls(stock_info_client: StockInformationClient, mock_kiwoom_client: KiwoomClient):
+    """
+    Test concurrent get_watchlist_stock_info calls are sent as one ka10095 request.
+    """
+    mock_kiwoom_client._authenticated_post.return_value = WatchlistInfoResponse(
+        atn_stk_infr=[
+            {"stk_cd": "005930", "stk_nm": "삼성전자", "cur_prc": "+71100"},
+            {"stk_cd": "000660", "stk_nm": "SK하이닉스", "cur_prc": "-180000"},
+        ],
+        return_code=0,
+        return_msg="정상적으로 처리되었습니다",
+    )
+
+    samsung, hynix, samsung_again = await asyncio.gather(
+        stock_info_client.get_watchlist_stock_info("005930"),
+        stock_info_client.get_watchlist_stock_info("000660"),
+        stock_info_client.get_watchlist_stock_info("005930"),
+    )
+
+    mock_kiwoom_client._authenticated_post.assert_called_once_with(
+        "/api/dostk/stkinfo",
+        response_model=WatchlistInfoResponse,
+        headers={"api-id": "ka10095"},
+        json={"stk_cd": "005930|000660"},
+    )
+    assert samsung.stock_name == "삼성전자"
+    assert samsung_again is samsung
+    assert hynix.current_price == "-180000"
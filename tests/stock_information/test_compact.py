@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+tests.stock_information.test_compact
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for the compact StockInfo snapshot.
+"""
+
+import pytest
+
+from kiwoom.stock_information.compact import StockSnapshot
+from kiwoom.stock_information.models import StockInfo
+
+_DATA = {
+    "stk_cd": "005930",
+    "stk_nm": "삼성전자",
+    "mrkt_type": "KOSPI",
+    "setl_mm": "12",
+    "fav": "5000",
+    "cap": "1311",
+    "flo_stk": "25527",
+    "crd_rt": "+0.08",
+    "oyr_hgst": "+181400",
+    "oyr_lwst": "-91200",
+    "mac": "24352",
+    "mac_wght": "",
+    "for_exh_rt": "0.00",
+    "repl_pric": "66780",
+    "per": "",
+    "eps": "1,234",
+    "roe": "007",
+    "bps": "-75300",
+    "sale_amt": "0",
+    "bus_pro": "0",
+    "cup_nga": "0",
+    "250hgst": "+124000",
+    "250lwst": "-66800",
+    "open_pric": "-0",
+    "high_pric": "95400",
+    "low_pric": "0",
+    "upl_pric": "20241016",
+    "lst_pric": "-47.41",
+    "base_pric": "20231024",
+    "exp_cntr_pric": "+26.69",
+    "exp_cntr_qty": "95400",
+    "250hgst_pric_dt": "3",
+    "250hgst_pric_pre_rt": "0",
+    "250lwst_pric_dt": "0.00",
+    "250lwst_pric_pre_rt": "0",
+    "cur_prc": "71100",
+    "prpr": "71100",
+    "flu_rt": "+1.25",
+    "return_code": 0,
+    "return_msg": "정상적으로 처리되었습니다",
+}
+
+
+@pytest.fixture
+def stocks():
+    return [
+        StockInfo(**_DATA),
+        StockInfo(**{**_DATA, "stk_cd": "000660", "stk_nm": "SK하이닉스", "mrkt_type": None}),
+    ]
+
+
+def test_round_trip_preserves_every_field(stocks):
+    """
+    Test converting to and from StockSnapshot keeps the original strings.
+    """
+    snapshot = StockSnapshot.from_stock_infos(stocks)
+
+    assert snapshot.to_stock_infos() == stocks
+    restored = snapshot.to_stock_info("005930")
+    assert restored.opening_price == "-0"
+    assert restored.credit_ratio == "+0.08"
+    assert restored.eps == "1,234"
+    assert restored.per == ""
+    assert restored.ev is None
+
+
+def test_compact_view_returns_native_values(stocks):
+    """
+    Test the per-symbol view exposes numeric fields as floats.
+    """
+    snapshot = StockSnapshot.from_stock_infos(stocks)
+    view = snapshot["005930"]
+
+    assert view.current_price == 71100.0
+    assert view.fluctuation_rate == 1.25
+    assert view.per is None
+    assert view.roe == "007"
+    assert view.stock_name == "삼성전자"
+    assert snapshot.codes == ["005930", "000660"]
+    with pytest.raises(AttributeError):
+        view.unknown_field
+
+
+def test_diff_returns_only_changed_fields(stocks):
+    """
+    Test diff reports changed fields per symbol, including for reordered snapshots.
+    """
+    old = StockSnapshot.from_stock_infos(stocks)
+    changed = StockInfo(**{**_DATA, "cur_prc": "71500", "flu_rt": "+1.82", "per": "12.5"})
+    new = StockSnapshot.from_stock_infos([stocks[1], changed])
+
+    assert old.diff(new) == {
+        "005930": {
+            "current_price": (71100.0, 71500.0),
+            "fluctuation_rate": (1.25, 1.82),
+            "per": (None, 12.5),
+        }
+    }
+    assert old.diff(StockSnapshot.from_stock_infos(stocks)) == {}
+
+
+@pytest.mark.parametrize(
+    "field, alias, old, new, expected",
+    [
+        ("eps", "eps", "1,234", "1,300", ("1,234", "1,300")),
+        ("roe", "roe", "007", "008", ("007", "008")),
+        ("settlement_month", "setl_mm", "03", "06", ("03", "06")),
+        ("opening_price", "open_pric", "-0", "0", ("-0", "0")),
+        ("per", "per", "", None, ("", None)),
+    ],
+)
+def test_diff_detects_changes_in_original_text(field, alias, old, new, expected):
+    """
+    Test diff reports changes between raw texts, signed zeros and empty/missing values.
+    """
+    before = StockSnapshot.from_stock_infos([StockInfo(**{**_DATA, alias: old})])
+    after = StockSnapshot.from_stock_infos([StockInfo(**{**_DATA, alias: new})])
+
+    assert before.diff(after) == {"005930": {field: expected}}
+    assert after.diff(before) == {"005930": {field: expected[::-1]}}
+
+
+def test_round_trip_preserves_fields_set():
+    """
+    Test restored StockInfo keeps the originally provided fields as model_fields_set.
+    """
+    partial = {key: value for key, value in _DATA.items() if key not in ("per", "mac_wght")}
+    stock = StockInfo(**partial)
+    snapshot = StockSnapshot.from_stock_infos([stock])
+
+    restored = snapshot.to_stock_info("005930")
+    assert restored.model_fields_set == stock.model_fields_set
+    assert "per" not in restored.model_fields_set
+    assert restored.model_dump(exclude_unset=True) == stock.model_dump(exclude_unset=True)
+
+
+def test_restore_keeps_signed_zeros_and_independent_instances():
+    """
+    Test cached decoding keeps "0" and "-0" apart and restored instances do not share state.
+    """
+    stocks = [
+        StockInfo(**{**_DATA, "stk_cd": "000001", "open_pric": "0", "for_exh_rt": "-0.00"}),
+        StockInfo(**{**_DATA, "stk_cd": "000002", "open_pric": "-0", "for_exh_rt": "0.00"}),
+    ]
+    snapshot = StockSnapshot.from_stock_infos(stocks)
+
+    restored = snapshot.to_stock_infos()
+    assert restored == stocks
+    assert [snapshot.to_stock_info(code) for code in snapshot] == stocks
+
+    restored[0].current_price = "1"
+    assert snapshot.to_stock_info("000001").current_price == "71100"
+    assert snapshot.to_stock_info("000002").model_fields_set == stocks[1].model_fields_set
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+tests.test_batching
+~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for request deduplication and micro-batching.
+"""
+
+import asyncio
+
+import pytest
+
+from kiwoom.batching import MicroBatcher, RequestCoalescer, request_key
+from kiwoom.exceptions import KiwoomAPIError
+
+
+def test_request_key_ignores_body_key_order():
+    """
+    Test identical bodies map to the same key regardless of key order.
+    """
+    assert request_key("ka10081", {"stk_cd": "005930", "base_dt": "20241108"}) == request_key(
+        "ka10081", {"base_dt": "20241108", "stk_cd": "005930"}
+    )
+    assert request_key("ka10081", {"stk_cd": "005930"}) != request_key("ka10080", {"stk_cd": "005930"})
+
+
+@pytest.mark.asyncio
+async def test_coalescer_keeps_shared_request_when_a_waiter_is_cancelled():
+    """
+    Test cancelling one waiter neither cancels the shared request nor the other waiters.
+    """
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "result"
+
+    cancelled = asyncio.ensure_future(coalescer.run("key", factory))
+    waiting = asyncio.ensure_future(coalescer.run("key", factory))
+    await asyncio.sleep(0)
+    assert coalescer.in_flight == 1
+
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiting == "result"
+    assert cancelled.cancelled()
+    assert calls == 1
+    assert coalescer.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_coalescer_raises_shared_failure_in_every_waiter_and_clears_key():
+    """
+    Test a failed shared request raises in all waiters and the next call starts a new request.
+    """
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        raise KiwoomAPIError(response=None, error_code="5", error_message="허용된 요청 개수를 초과하였습니다")
+
+    results = await asyncio.gather(*(coalescer.run("key", failing) for _ in range(3)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(result, KiwoomAPIError) for result in results)
+    assert coalescer.in_flight == 0
+
+    async def succeeding():
+        return "retried"
+
+    assert await coalescer.run("key", succeeding) == "retried"
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_splits_full_batches_and_reports_missing_keys():
+    """
+    Test batches are capped at max_batch_size and keys missing from the result raise.
+    """
+    batches = []
+
+    async def batch_fn(keys):
+        batches.append(list(keys))
+        return {key: key.upper() for key in keys if key != "missing"}
+
+    batcher = MicroBatcher(batch_fn, window=0.01, max_batch_size=2)
+
+    results = await asyncio.gather(
+        batcher.submit("a"), batcher.submit("b"), batcher.submit("c"), batcher.submit("missing"),
+        return_exceptions=True,
+    )
+
+    assert batches == [["a", "b"], ["c", "missing"]]
+    assert results[:3] == ["A", "B", "C"]
+    assert isinstance(results[3], KiwoomAPIError)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+tests.test_concurrency
+~~~~~~~~~~~~~~~~~~~~~~
+
+This module contains unit tests for the adaptive concurrency limiter.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from httpx import Response
+
+from kiwoom.concurrency import AdaptiveConcurrencyLimiter
+from kiwoom.core import KiwoomBaseClient
+from kiwoom.exceptions import KiwoomAPIError
+from kiwoom.models import BaseKiwoomResponse
+
+
+def _error_response(status_code: int) -> Response:
+    return Response(status_code=status_code, request=httpx.Request("POST", "http://test.com"))
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat():
+    """
+    The limit should increase while every slot is in use and latency stays flat.
+    """
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8, latency_tolerance=10.0)
+
+    async def call():
+        async with limiter.slot():
+            await asyncio.sleep(0.001)
+
+    for _ in range(20):
+        await asyncio.gather(*(call() for _ in range(limiter.limit)))
+
+    assert limiter.limit > 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limit_backs_off_on_throttle_and_server_errors():
+    """
+    Throttle return codes and HTTP 429/5xx responses should cut the limit.
+    """
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+
+    with pytest.raises(KiwoomAPIError):
+        async with limiter.slot():
+            raise KiwoomAPIError(response=None, error_code=5, error_message="허용된 요청 개수를 초과하였습니다")
+    assert limiter.limit == 7
+
+    limiter._last_decrease = 0.0
+    with pytest.raises(KiwoomAPIError):
+        async with limiter.slot():
+            raise KiwoomAPIError(response=_error_response(503))
+    assert limiter.limit == 4
+
+    with pytest.raises(KiwoomAPIError):
+        async with limiter.slot():
+            raise KiwoomAPIError(response=_error_response(400), error_code=-1)
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_throttles_on_cold_limiter_back_off_once():
+    """
+    A burst of throttled requests before any success should cut the limit only once.
+    """
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=16)
+    started = asyncio.Event()
+
+    async def call():
+        async with limiter.slot():
+            await started.wait()
+            raise KiwoomAPIError(response=None, error_code=5, error_message="허용된 요청 개수를 초과하였습니다")
+
+    tasks = [asyncio.ensure_future(call()) for _ in range(16)]
+    await asyncio.sleep(0)
+    started.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, KiwoomAPIError) for result in results)
+    assert limiter.limit == 11
+    assert limiter.in_flight == 0
+
+    # 감소 이후에 시작된 요청의 스로틀은 새 혼잡 구간으로 봅니다.
+    with pytest.raises(KiwoomAPIError):
+        await call()
+    assert limiter.limit == 7
+
+
+@pytest.mark.asyncio
+async def test_slot_blocks_above_limit():
+    """
+    No more than `limit` requests should be in flight at once.
+    """
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+
+    await asyncio.gather(*(call() for _ in range(10)))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_request_reports_api_error_code_to_limiter(mocker):
+    """
+    `_request` should keep the API return_code so the limiter can detect throttling.
+    """
+    http_client = mocker.MagicMock(spec=httpx.AsyncClient)
+    http_client.request = mocker.AsyncMock(
+        return_value=Response(
+            status_code=200,
+            json={"return_code": 5, "return_msg": "허용된 요청 개수를 초과하였습니다"},
+            request=httpx.Request("POST", "http://test.com/api/dostk/stkinfo"),
+        )
+    )
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+    client = KiwoomBaseClient("http://test.com", http_client, "ws://test.com", limiter=limiter)
+
+    with pytest.raises(KiwoomAPIError) as excinfo:
+        await client._post("/api/dostk/stkinfo", BaseKiwoomResponse, json={})
+
+    assert excinfo.value.error_code == 5
+    assert client.concurrency_limit == 7
+
+
+@pytest.mark.asyncio
+async def test_request_timeouts_count_as_overload(mocker):
+    """
+    Transport timeouts wrapped in KiwoomAPIError should cut the limit.
+    """
+    http_client = mocker.MagicMock(spec=httpx.AsyncClient)
+    http_client.request = mocker.AsyncMock(side_effect=httpx.ReadTimeout("timed out"))
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+    client = KiwoomBaseClient("http://test.com", http_client, "ws://test.com", limiter=limiter)
+
+    for _ in range(5):
+        with pytest.raises(KiwoomAPIError) as excinfo:
+            await client._post("/api/dostk/stkinfo", BaseKiwoomResponse, json={})
+        assert isinstance(excinfo.value.__cause__, httpx.ReadTimeout)
+
+    assert client.concurrency_limit < 10
+    assert limiter.in_flight == 0
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=10)
+    with pytest.raises(httpx.PoolTimeout):
+        async with limiter.slot():
+            raise httpx.PoolTimeout("no connection available")
+    assert limiter.limit == 7